@@ -1,2 +1,5 @@
 # Version for Typer CLI tools
 __version__ = "0.1.1"
+
+# GDAL块缓存的默认大小（MB），库调用与命令行共用；用户通过环境变量或 --cachemax 指定时不覆盖
+_GDAL_CACHEMAX_MB = 512
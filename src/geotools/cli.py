@@ -1,65 +1,304 @@
-import typer
+from typing import Any, Dict, Iterable, List, Optional, Union
+import argparse
+import functools
+import math
+import os
+import sys
 
-from .funcs import (
-    analyze_tiff_comprehensive,
-    create_display_functions,
-    process_tiff_conversion,
-    process_tiff_cropping,
-)
+from . import _GDAL_CACHEMAX_MB
 
-# 创建显示函数模块
-display_funcs = create_display_functions()
 
+def _convert_one(
+    input_tif: str,
+    output_png: str,
+    truncated_value: int,
+    downsample: int,
+    show_info: bool,
+    compress_level: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """转换单个文件，需要显示信息时返回完整的处理结果"""
+    # 仅在真正执行时加载GDAL/numpy相关模块，--help 无需承担导入开销
+    from . import funcs
 
-def tiff2png_cli():
-    def main(
-        input_tif: str,
-        output_png: str,
-        truncated_value: int = typer.Option(1, help="量化截断百分比"),
-        downsample: int = typer.Option(1, help="降采样倍数 (如2表示缩小为1/2)"),
-        show_info: bool = typer.Option(True, help="处理完成后显示详细信息"),
-    ):
-        """将tiff通过量化转换为png - 超详细版本"""
-        # 执行转换流程
-        results = process_tiff_conversion(
-            input_tif, output_png, truncated_value, downsample
+    # 不显示信息时只做转换本身，跳过输入/输出文件的分析统计
+    if not show_info:
+        funcs.tiff2png(input_tif, output_png, truncated_value, downsample, compress_level)
+        return None
+
+    # 执行转换流程
+    return funcs.process_tiff_conversion(
+        input_tif, output_png, truncated_value, downsample, compress_level
+    )
+
+
+def _show_conversion_results(all_results: Iterable[Optional[Dict[str, Any]]], show_info: bool):
+    """按输入顺序逐个取回转换结果并显示，工作进程中的异常也在此处抛出"""
+    display = None
+    if show_info:
+        from .funcs import display_conversion_results as display
+
+    for results in all_results:
+        if display is not None:
+            display(results)
+
+
+def _expand_input_lists(paths: Iterable[str]) -> List[str]:
+    """展开 @列表文件：以@开头的参数视为列表文件，每行一个输入路径（忽略空行）"""
+    expanded: List[str] = []
+    for path in paths:
+        if path.startswith("@"):
+            with open(path[1:], encoding="utf-8") as list_file:
+                expanded.extend(line.strip() for line in list_file if line.strip())
+        else:
+            expanded.append(path)
+    return expanded
+
+
+def tiff2png(
+    input_tif: Union[str, List[str]],
+    output_png: str,
+    truncated_value: int = 1,
+    downsample: int = 1,
+    show_info: bool = True,
+    workers: Optional[int] = None,
+    compress_level: Optional[int] = None,
+):
+    """将tiff通过量化转换为png - 超详细版本"""
+    from .funcs import _process_pool
+
+    inputs = _expand_input_lists([input_tif] if isinstance(input_tif, str) else input_tif)
+
+    if len(inputs) == 1:
+        results = _convert_one(
+            inputs[0], output_png, truncated_value, downsample, show_info, compress_level
         )
+        _show_conversion_results([results], show_info)
+        return
 
-        # 显示结果
-        if show_info:
-            display_funcs["display_conversion_results"](results)
+    # 多个输入时 output_png 视为输出目录，按输入文件名生成对应的PNG
+    outputs = [
+        os.path.join(output_png, os.path.splitext(os.path.basename(path))[0] + ".png")
+        for path in inputs
+    ]
+    # 不同目录下的同名输入会写到同一个PNG，在启动进程池之前报错，避免结果被静默覆盖
+    sources_by_output: Dict[str, List[str]] = {}
+    for path, output in zip(inputs, outputs):
+        sources_by_output.setdefault(output, []).append(path)
+    duplicates = {output: paths for output, paths in sources_by_output.items() if len(paths) > 1}
+    if duplicates:
+        details = "; ".join(f"{output} <- {', '.join(paths)}" for output, paths in duplicates.items())
+        sys.exit(f"tiff2png: 错误: 多个输入对应同一个输出文件: {details}")
+    os.makedirs(output_png, exist_ok=True)
+    count = len(inputs)
+    with _process_pool(workers) as pool:
+        all_results = pool.map(
+            _convert_one,
+            inputs,
+            outputs,
+            [truncated_value] * count,
+            [downsample] * count,
+            [show_info] * count,
+            [compress_level] * count,
+        )
+        _show_conversion_results(all_results, show_info)
 
-    typer.run(main)
 
+def cutiff(
+    input_tif: str,
+    output_tif: str,
+    xoff: int,
+    yoff: int,
+    xsize: int,
+    ysize: int,
+    show_info: bool = True,
+):
+    """给定坐标裁切tiff - 超详细版本"""
+    from . import funcs
 
-def cutiff_cli():
-    def main(
-        input_tif: str,
-        output_tif: str,
-        xoff: int,
-        yoff: int,
-        xsize: int,
-        ysize: int,
-        show_info: bool = typer.Option(True, help="处理完成后显示超详细信息"),
-    ):
-        """给定坐标裁切tiff - 超详细版本"""
-        # 执行裁切流程
-        results = process_tiff_cropping(input_tif, output_tif, xoff, yoff, xsize, ysize)
-
-        # 显示结果
-        if show_info:
-            display_funcs["display_cropping_results"](results)
-
-    typer.run(main)
+    if not show_info:
+        # 不显示报告时越界等错误无处展示，以简洁的错误信息退出（不打印异常堆栈）
+        try:
+            funcs.cutiff(input_tif, output_tif, xoff, yoff, xsize, ysize)
+        except RuntimeError as e:
+            sys.exit(f"cutiff: 错误: {e}")
+        return
 
+    # 执行裁切流程
+    results = funcs.process_tiff_cropping(input_tif, output_tif, xoff, yoff, xsize, ysize)
 
-def tiffinfo_cli():
-    def main(input_tif: str):
-        """查看TIFF图像超详细信息 - 终极版本"""
-        # 使用新的综合分析函数
-        analysis = analyze_tiff_comprehensive(input_tif)
+    # 显示结果
+    funcs.display_cropping_results(results)
+
+
+def _json_default(obj: Any) -> Any:
+    """json序列化兜底：时间转ISO字符串，numpy标量/数组转原生类型"""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_compatible(obj: Any) -> Any:
+    """递归转换为标准JSON可表示的值：NaN/Inf（如无有效像素时的统计量）转为None
+
+    Python的json默认输出 NaN/Infinity，这不是合法JSON，jq 等严格解析器会拒绝。
+    """
+    if isinstance(obj, dict):
+        return {key: _json_compatible(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_compatible(value) for value in obj]
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if hasattr(obj, "tolist") and not hasattr(obj, "isoformat"):
+        return _json_compatible(obj.tolist())
+    return obj
+
+
+def tiffinfo(input_tif: str, json_output: bool = False):
+    """查看TIFF图像超详细信息 - 终极版本"""
+    from .funcs import analyze_tiff_comprehensive
+
+    # 使用新的综合分析函数
+    analysis = analyze_tiff_comprehensive(input_tif)
+
+    # 机器可读输出：直接写JSON，跳过Rich渲染，便于管道处理
+    if json_output:
+        import json
+
+        document = _json_compatible(analysis)
+        sys.stdout.write(json.dumps(document, ensure_ascii=False, allow_nan=False, default=_json_default))
+        sys.stdout.write("\n")
+        return
+
+    from .funcs import display_comprehensive_info
 
-        # 显示综合信息
-        display_funcs["display_comprehensive_info"](analysis)
+    # 显示综合信息
+    display_comprehensive_info(analysis)
 
-    typer.run(main)
+
+def _bootstrap_gdal_env(cachemax=None, num_threads=None):
+    """在加载GDAL之前通过环境变量设置全局配置，后续所有 gdal.Open 均受益
+
+    Args:
+        cachemax: GDAL块缓存大小（MB），None表示沿用环境变量或默认值 _GDAL_CACHEMAX_MB
+        num_threads: GDAL解码线程数（如 ALL_CPUS），None表示不设置
+    """
+    # 打开文件时不扫描同级目录，避免在大目录/网络存储上的额外开销
+    os.environ.setdefault("GDAL_DISABLE_READDIR_ON_OPEN", "EMPTY_DIR")
+    if cachemax is not None:
+        os.environ["GDAL_CACHEMAX"] = str(cachemax)
+    else:
+        os.environ.setdefault("GDAL_CACHEMAX", str(_GDAL_CACHEMAX_MB))
+    if num_threads is not None:
+        os.environ["GDAL_NUM_THREADS"] = str(num_threads)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """构建命令行解析器（进程内只构建一次），每个子命令对应一个控制台脚本"""
+    parser = argparse.ArgumentParser(prog="geotools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    formatter = argparse.ArgumentDefaultsHelpFormatter
+
+    # 所有子命令共享的GDAL配置选项
+    gdal_options = argparse.ArgumentParser(add_help=False)
+    group = gdal_options.add_argument_group("GDAL选项")
+    group.add_argument(
+        "--cachemax", type=int, default=argparse.SUPPRESS, help=f"GDAL块缓存大小 (MB)，默认{_GDAL_CACHEMAX_MB}"
+    )
+    group.add_argument(
+        "--num-threads", default=argparse.SUPPRESS, help="GDAL解码线程数 (如 ALL_CPUS)"
+    )
+
+    p = subparsers.add_parser(
+        "tiff2png",
+        prog="tiff2png",
+        help=tiff2png.__doc__,
+        description=tiff2png.__doc__,
+        formatter_class=formatter,
+        parents=[gdal_options],
+    )
+    p.add_argument("input_tif", nargs="+", help="输入TIFF文件，可指定多个或使用 @列表文件")
+    p.add_argument("output_png", help="输出PNG文件；多个输入时为输出目录")
+    p.add_argument("--truncated-value", type=int, default=1, help="量化截断百分比")
+    p.add_argument("--downsample", type=int, default=1, help="降采样倍数 (如2表示缩小为1/2)")
+    p.add_argument(
+        "--show-info", action=argparse.BooleanOptionalAction, default=True, help="处理完成后显示详细信息"
+    )
+    p.add_argument(
+        "--compress-level",
+        type=int,
+        default=None,
+        choices=range(10),
+        metavar="{0-9}",
+        help="PNG压缩级别，越大文件越小但写入越慢；不指定时使用OpenCV的快速预设",
+    )
+    p.add_argument(
+        "--workers", type=int, default=argparse.SUPPRESS, help="多文件批处理的并行进程数，默认CPU核数"
+    )
+    p.set_defaults(func=tiff2png)
+
+    p = subparsers.add_parser(
+        "cutiff",
+        prog="cutiff",
+        help=cutiff.__doc__,
+        description=cutiff.__doc__,
+        formatter_class=formatter,
+        parents=[gdal_options],
+    )
+    p.add_argument("input_tif")
+    p.add_argument("output_tif")
+    for name in ("xoff", "yoff", "xsize", "ysize"):
+        p.add_argument(name, type=int)
+    p.add_argument(
+        "--show-info", action=argparse.BooleanOptionalAction, default=True, help="处理完成后显示超详细信息"
+    )
+    p.set_defaults(func=cutiff)
+
+    p = subparsers.add_parser(
+        "tiffinfo",
+        prog="tiffinfo",
+        help=tiffinfo.__doc__,
+        description=tiffinfo.__doc__,
+        formatter_class=formatter,
+        parents=[gdal_options],
+    )
+    p.add_argument("input_tif")
+    p.add_argument(
+        "--json", dest="json_output", action="store_true", help="以JSON格式输出分析结果 (不使用Rich渲染)"
+    )
+    p.set_defaults(func=tiffinfo)
+
+    return parser
+
+
+def _dispatch(argv: List[str]):
+    """解析命令行参数（首个参数为子命令）并执行对应子命令"""
+    args = vars(_build_parser().parse_args(argv))
+    func = args.pop("func")
+    del args["command"]
+    _bootstrap_gdal_env(args.pop("cachemax", None), args.pop("num_threads", None))
+    func(**args)
+
+
+def _run(command: str):
+    """以固定子命令执行，供各独立控制台脚本使用"""
+    _dispatch([command, *sys.argv[1:]])
+
+
+def main():
+    """统一入口：geotools <tiff2png|cutiff|tiffinfo> ..."""
+    _dispatch(sys.argv[1:])
+
+
+def tiff2png_cli():
+    _run("tiff2png")
+
+
+def cutiff_cli():
+    _run("cutiff")
+
+
+def tiffinfo_cli():
+    _run("tiffinfo")
@@ -15,23 +15,56 @@ GeoTools 核心功能模块
 """
 
 from typing import Any, Dict, List, Optional, Tuple, Union
+import copy
 import datetime
+import functools
 import math
 import os
 import re
+import struct
+import threading
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import cv2
 import numpy as np
 from osgeo import gdal, osr
+from rich.console import Console
+from rich.highlighter import NullHighlighter
+from rich.text import Text
+
+from . import _GDAL_CACHEMAX_MB
 
 # Enable GDAL exceptions to handle errors properly
 gdal.UseExceptions()
 
+# 加速打开/读取的GDAL默认配置，仅在用户未通过配置或环境变量指定时生效
+_GDAL_DEFAULT_CONFIG = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "GDAL_CACHEMAX": str(_GDAL_CACHEMAX_MB),
+    "GDAL_NUM_THREADS": "ALL_CPUS",
+    "VSI_CACHE": "TRUE",
+    # 计算出的统计信息写入 .aux.xml，下次分析直接读取
+    "GDAL_PAM_ENABLED": "YES",
+}
+for _key, _value in _GDAL_DEFAULT_CONFIG.items():
+    if gdal.GetConfigOption(_key) is None:
+        gdal.SetConfigOption(_key, _value)
+del _key, _value
+
+# 没有地理参考的影像返回的默认地理变换（像素坐标即图像坐标）
+_IDENTITY_GEOTRANSFORM = (0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+
 
 # ===========================
 # 核心工具函数模块
 # ===========================
 
+# 打开待读取栅格数据集时使用的标志
+_READ_RASTER_FLAGS = gdal.OF_READONLY | gdal.OF_RASTER | gdal.OF_VERBOSE_ERROR
+
+
 def _safe_open_dataset(file_path: str) -> gdal.Dataset:
     """安全打开GDAL数据集
 
@@ -44,18 +77,20 @@ def _safe_open_dataset(file_path: str) -> gdal.Dataset:
     Raises:
         RuntimeError: 如果无法打开文件
     """
-    dataset = gdal.Open(file_path)
+    # 所有调用方都只读取栅格数据：以只读方式打开并只尝试栅格驱动，跳过矢量驱动探测
+    dataset = gdal.OpenEx(file_path, _READ_RASTER_FLAGS)
     if dataset is None:
         raise RuntimeError(f"无法打开文件: {file_path}")
     return dataset
 
 
-def _safe_read_array(dataset: gdal.Dataset, *args) -> np.ndarray:
+def _safe_read_array(dataset: Union[gdal.Dataset, gdal.Band], *args, **kwargs) -> np.ndarray:
     """安全读取数组数据
 
     Args:
-        dataset: GDAL数据集对象
-        *args: ReadAsArray的参数
+        dataset: GDAL数据集或波段对象
+        *args: ReadAsArray的位置参数
+        **kwargs: ReadAsArray的关键字参数（如 buf_xsize/buf_ysize）
 
     Returns:
         np.ndarray: 数组数据
@@ -63,7 +98,7 @@ def _safe_read_array(dataset: gdal.Dataset, *args) -> np.ndarray:
     Raises:
         RuntimeError: 如果无法读取数据
     """
-    array = dataset.ReadAsArray(*args)
+    array = dataset.ReadAsArray(*args, **kwargs)
     if array is None:
         raise RuntimeError(f"无法读取文件数据")
     return array
@@ -72,6 +107,10 @@ def _safe_read_array(dataset: gdal.Dataset, *args) -> np.ndarray:
 def _create_coordinate_transform(source_wkt: str, target_epsg: int = 4326) -> osr.CoordinateTransformation:
     """创建坐标转换对象
 
+    相同坐标系的转换对象会被缓存复用，避免重复解析WKT和初始化PROJ。
+    CoordinateTransformation 不能在线程间并发使用，因此缓存按线程区分，
+    每个线程拿到的都是自己独占的对象。
+
     Args:
         source_wkt: 源坐标系WKT字符串
         target_epsg: 目标坐标系EPSG代码，默认为4326(WGS84)
@@ -82,96 +121,133 @@ def _create_coordinate_transform(source_wkt: str, target_epsg: int = 4326) -> os
     Raises:
         Exception: 如果无法创建坐标转换
     """
+    return _cached_coordinate_transform(source_wkt, target_epsg, threading.get_ident())
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_coordinate_transform(
+    source_wkt: str, target_epsg: int, thread_id: int
+) -> osr.CoordinateTransformation:
+    """按 (源WKT, 目标EPSG, 线程) 缓存坐标转换对象，目标坐标系随转换对象一起只构建一次
+
+    两个坐标系都使用传统GIS轴序 (X/经度, Y/纬度)：GDAL 3 默认遵循EPSG定义的轴序，
+    EPSG:4326 会按 (纬度, 经度) 输出，而本模块的调用方均按 (经度, 纬度) 解读结果。
+    """
     source_srs = osr.SpatialReference()
     source_srs.ImportFromWkt(source_wkt)
+    source_srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
 
     target_srs = osr.SpatialReference()
     target_srs.ImportFromEPSG(target_epsg)
+    target_srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
 
     return osr.CoordinateTransformation(source_srs, target_srs)
 
 
-def _transform_corners_to_geographic(
-    geotransform: tuple,
-    projection: str,
-    width: int,
-    height: int
-) -> Tuple[List[Tuple[float, float]], Dict[str, float]]:
-    """将图像四角点转换为地理坐标
+def _as_coordinate_transform(
+    projection: Union[str, osr.CoordinateTransformation]
+) -> osr.CoordinateTransformation:
+    """接受WKT字符串或已创建的坐标转换对象，统一返回到WGS84的坐标转换对象"""
+    if isinstance(projection, osr.CoordinateTransformation):
+        return projection
+    return _create_coordinate_transform(projection)
+
+
+def _pixels_to_projected(geotransform: tuple, pixels: Any) -> np.ndarray:
+    """按地理变换参数将像素坐标批量转换为投影坐标
 
     Args:
         geotransform: GDAL地理变换参数
-        projection: 投影坐标系WKT字符串
-        width: 图像宽度
-        height: 图像高度
+        pixels: 像素坐标序列，形状为 (N, 2)，每行为 (列, 行)
 
     Returns:
-        tuple: (角点地理坐标列表, 边界字典)
+        np.ndarray: 投影坐标数组，形状为 (N, 2)，每行为 (X, Y)
     """
-    transform = _create_coordinate_transform(projection)
+    gt = geotransform
+    affine = np.array([[gt[1], gt[2], gt[0]], [gt[4], gt[5], gt[3]]], dtype=np.float64)
+    pixels = np.asarray(pixels, dtype=np.float64).reshape(-1, 2)
+    homogeneous = np.column_stack((pixels, np.ones(len(pixels))))
+    return homogeneous @ affine.T
 
-    # 定义四个角点的像素坐标
-    corners_pixel = [(0, 0), (width, 0), (width, height), (0, height)]
 
-    # 转换为地理坐标
-    corners_geo = []
-    for px, py in corners_pixel:
-        # 像素坐标转投影坐标
-        proj_x = geotransform[0] + px * geotransform[1] + py * geotransform[2]
-        proj_y = geotransform[3] + px * geotransform[4] + py * geotransform[5]
+# 计算地理边界时每条边的采样点数（含两端角点）：弯曲的经纬线在投影坐标系下的
+# 极值可能落在边的中部，只转换四个角点会低估边界
+_EDGE_DENSIFY_POINTS = 32
 
-        # 投影坐标转地理坐标
-        lon, lat, _ = transform.TransformPoint(proj_x, proj_y)
-        corners_geo.append((lon, lat))
 
-    # 计算边界范围
-    lons = [corner[0] for corner in corners_geo]
-    lats = [corner[1] for corner in corners_geo]
+def _edge_pixels(width: int, height: int) -> np.ndarray:
+    """沿图像四条边加密采样的像素坐标，形状为 (4 * _EDGE_DENSIFY_POINTS, 2)"""
+    t = np.linspace(0.0, 1.0, _EDGE_DENSIFY_POINTS)
+    xs, ys = t * width, t * height
+    zeros = np.zeros_like(t)
+    return np.concatenate((
+        np.column_stack((xs, zeros)),               # 上边
+        np.column_stack((zeros + width, ys)),       # 右边
+        np.column_stack((xs, zeros + height)),      # 下边
+        np.column_stack((zeros, ys)),               # 左边
+    ))
 
-    bounds = {
-        "west": min(lons),
-        "east": max(lons),
-        "south": min(lats),
-        "north": max(lats),
-    }
-
-    return corners_geo, bounds
 
+def _geographic_bounds_and_center(
+    geotransform: tuple,
+    projection: Union[str, osr.CoordinateTransformation],
+    width: int,
+    height: int
+) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """计算图像的地理边界和中心点
 
-def _calculate_geographic_center(geotransform: tuple, projection: str, width: int, height: int) -> Dict[str, float]:
-    """计算图像中心的地理坐标
+    四条边的加密采样点与中心点一起做一次 TransformPoints 批量转换。
 
     Args:
         geotransform: GDAL地理变换参数
-        projection: 投影坐标系WKT字符串
+        projection: 投影坐标系WKT字符串，或已创建的坐标转换对象
         width: 图像宽度
         height: 图像高度
 
     Returns:
-        dict: 包含longitude和latitude的字典
+        tuple: (边界字典, 包含longitude和latitude的中心点字典)
     """
-    transform = _create_coordinate_transform(projection)
+    transform = _as_coordinate_transform(projection)
+
+    # 四条边的加密采样点，最后追加中心点
+    pixels = np.vstack((_edge_pixels(width, height), (width / 2, height / 2)))
 
-    # 计算中心点投影坐标
-    center_x = geotransform[0] + width / 2 * geotransform[1] + height / 2 * geotransform[2]
-    center_y = geotransform[3] + width / 2 * geotransform[4] + height / 2 * geotransform[5]
+    # 像素坐标转投影坐标，再一次调用转换为地理坐标
+    projected = _pixels_to_projected(geotransform, pixels).tolist()
+    geo = np.asarray(transform.TransformPoints(projected), dtype=np.float64)[:, :2]
 
-    # 转换为地理坐标
-    center_lon, center_lat, _ = transform.TransformPoint(center_x, center_y)
+    # 由边界采样点计算边界范围（按列向量化归约）
+    edges = geo[:-1]
+    lon_min, lat_min = edges.min(axis=0).tolist()
+    lon_max, lat_max = edges.max(axis=0).tolist()
 
-    return {"longitude": center_lon, "latitude": center_lat}
+    bounds = {
+        "west": lon_min,
+        "east": lon_max,
+        "south": lat_min,
+        "north": lat_max,
+    }
 
+    center_lon, center_lat = geo[-1].tolist()
+    return bounds, {"longitude": center_lon, "latitude": center_lat}
 
-def _get_band_statistics(band: gdal.Band) -> Dict[str, Optional[float]]:
+
+def _get_band_statistics(band: gdal.Band, force: bool = True) -> Dict[str, Optional[float]]:
     """获取波段统计信息
 
     Args:
         band: GDAL波段对象
+        force: 没有已缓存的统计信息时是否按抽样像素近似计算；为False时只读取
+            文件/PAM中已有的统计信息，不存在则全部为None
 
     Returns:
         dict: 包含统计信息的字典
     """
-    stats = band.GetStatistics(True, True)
+    # 优先读取文件/PAM中已缓存的统计信息，只是元数据查询
+    stats = band.GetStatistics(True, False)
+    # 没有缓存时，部分GDAL版本返回标准差为负的占位结果
+    if not stats or stats[3] < 0:
+        stats = band.ComputeStatistics(True) if force else None
     return {
         "MinValue": stats[0] if stats else None,
         "MaxValue": stats[1] if stats else None,
@@ -180,6 +256,10 @@ def _get_band_statistics(band: gdal.Band) -> Dict[str, Optional[float]]:
     }
 
 
+# 投影WKT关键字名称匹配（PROJCS/GEOGCS/DATUM 合并为一次扫描）
+_PROJ_INFO_RE = re.compile(r'(PROJCS|GEOGCS|DATUM)\["([^"]+)"')
+
+
 def _extract_projection_info(projection: str) -> Dict[str, Optional[str]]:
     """从投影WKT字符串中提取关键信息
 
@@ -194,20 +274,40 @@ def _extract_projection_info(projection: str) -> Dict[str, Optional[str]]:
     if not projection:
         return info
 
-    patterns = {
-        "projcs": r'PROJCS\["([^"]+)"',
-        "geogcs": r'GEOGCS\["([^"]+)"',
-        "datum": r'DATUM\["([^"]+)"'
-    }
-
-    for key, pattern in patterns.items():
-        match = re.search(pattern, projection)
-        if match:
-            info[key] = match.group(1)
+    # 单次扫描WKT，每个关键字只保留首次出现的名称
+    for match in _PROJ_INFO_RE.finditer(projection):
+        key = match.group(1).lower()
+        if info[key] is None:
+            info[key] = match.group(2)
 
     return info
 
 
+@functools.lru_cache(maxsize=128)
+def _srs_units(
+    projection: str,
+) -> Tuple[Optional[str], Optional[float], Optional[float], Optional[float]]:
+    """解析投影WKT的线性单位（按WKT缓存，重复的坐标系无需再次解析）
+
+    Args:
+        projection: 投影坐标系WKT字符串
+
+    Returns:
+        tuple: (单位名称, 单位到米的换算系数, 单位到千米的换算系数,
+            平方单位到平方千米的换算系数)，解析失败时全部为None
+    """
+    try:
+        srs = osr.SpatialReference()
+        srs.ImportFromWkt(projection)
+        unit_name, unit_to_meter = srs.GetLinearUnitsName(), srs.GetLinearUnits()
+    except Exception:
+        # 失败结果同样缓存，避免对同一个无效WKT反复解析
+        return None, None, None, None
+    # 换算系数随坐标系一起缓存，调用方每个维度只需一次乘法
+    unit_to_km = unit_to_meter / 1000.0
+    return unit_name, unit_to_meter, unit_to_km, unit_to_km * unit_to_km
+
+
 def _calculate_file_compression_ratio(actual_size: Union[int, float], uncompressed_size: Union[int, float]) -> float:
     """计算文件压缩率
 
@@ -251,55 +351,10 @@ def transform_projected_to_geographic(
     geographic_center = None
 
     try:
-        # 创建坐标转换
-        source_srs = osr.SpatialReference()
-        source_srs.ImportFromWkt(projection)
-
-        target_srs = osr.SpatialReference()
-        target_srs.ImportFromEPSG(4326)  # WGS84经纬度坐标系
-
-        transform = osr.CoordinateTransformation(source_srs, target_srs)
-
-        # 计算影像四个角点的投影坐标
-        corners_pixel = [
-            (0, 0),  # 左上角
-            (width, 0),  # 右上角
-            (width, height),  # 右下角
-            (0, height),  # 左下角
-        ]
-
-        # 转换为投影坐标，然后转换为地理坐标
-        corners_geo = []
-        for px, py in corners_pixel:
-            # 像素坐标转投影坐标
-            proj_x = geotransform[0] + px * geotransform[1] + py * geotransform[2]
-            proj_y = geotransform[3] + px * geotransform[4] + py * geotransform[5]
-
-            # 投影坐标转地理坐标
-            lon, lat, _ = transform.TransformPoint(proj_x, proj_y)
-            corners_geo.append((lon, lat))
-
-        # 计算边界范围
-        lons = [corner[0] for corner in corners_geo]
-        lats = [corner[1] for corner in corners_geo]
-
-        geographic_bounds = {
-            "west": min(lons),
-            "east": max(lons),
-            "south": min(lats),
-            "north": max(lats),
-        }
-
-        # 计算中心点
-        center_x = (
-            geotransform[0] + width / 2 * geotransform[1] + height / 2 * geotransform[2]
-        )
-        center_y = (
-            geotransform[3] + width / 2 * geotransform[4] + height / 2 * geotransform[5]
+        transform = _create_coordinate_transform(projection)
+        geographic_bounds, geographic_center = _geographic_bounds_and_center(
+            geotransform, transform, width, height
         )
-        center_lon, center_lat, _ = transform.TransformPoint(center_x, center_y)
-
-        geographic_center = {"longitude": center_lon, "latitude": center_lat}
 
     except Exception:
         # 如果转换失败，保持None值
@@ -380,6 +435,142 @@ def xy_to_lonlat(x: float, y: float, proj_wkt: str) -> Tuple[float, float]:
 # ===========================
 
 
+def _histogram_percentiles(hist: np.ndarray, percentiles: Tuple[float, ...]) -> List[float]:
+    """根据整数值直方图计算百分位数，与 np.percentile 默认的线性插值一致
+
+    Args:
+        hist: 直方图，hist[v] 为取值 v 的像素个数
+        percentiles: 需要计算的百分位数（0-100）
+
+    Returns:
+        list: 与 percentiles 一一对应的百分位数值
+    """
+    cdf = np.cumsum(hist)
+    last = int(cdf[-1]) - 1
+    values = []
+    for q in percentiles:
+        # 排序后第 k 个元素即累计计数首次超过 k 的取值
+        position = q / 100 * last
+        k = math.floor(position)
+        below, above = np.searchsorted(cdf, [k, min(k + 1, last)], side="right")
+        values.append(_lerp(below, above, position - k))
+    return values
+
+
+def _partition_percentiles(values: np.ndarray, percentiles: Tuple[float, ...]) -> List[float]:
+    """用 np.partition 选出所需的顺序统计量计算百分位数，与 np.percentile 默认的线性插值一致
+
+    只需要少数几个分位点时无需完整排序，选择算法为O(N)。
+
+    Args:
+        values: 输入数组（任意形状，按展平后计算）
+        percentiles: 需要计算的百分位数（0-100）
+
+    Returns:
+        list: 与 percentiles 一一对应的百分位数值
+    """
+    flat = values.ravel()
+    last = flat.size - 1
+    positions = [q / 100 * last for q in percentiles]
+    kth = sorted({k for p in positions for k in (math.floor(p), min(math.floor(p) + 1, last))})
+    partitioned = np.partition(flat, kth)
+    return [
+        _lerp(partitioned[math.floor(p)], partitioned[min(math.floor(p) + 1, last)], p - math.floor(p))
+        for p in positions
+    ]
+
+
+def _lerp(below: float, above: float, t: float) -> float:
+    """相邻两个顺序统计量之间的线性插值（与numpy相同，t>=0.5时从上端计算）"""
+    below, above = float(below), float(above)
+    diff = above - below
+    return above - diff * (1 - t) if t >= 0.5 else below + diff * t
+
+
+def _stretch_lut(size: int, lo: float, hi: float, max_out: int, min_out: int) -> np.ndarray:
+    """生成整数取值 0..size-1 的拉伸查找表，计算方式与浮点路径逐像素拉伸相同
+
+    按 (x - lo) / (hi - lo) * (max_out - min_out) + min_out 的顺序运算；
+    预先合并为单个缩放系数会在个别取值上产生1个灰阶的舍入差异。
+    """
+    lut = np.arange(size, dtype=np.float64)
+    np.subtract(lut, lo, out=lut)
+    np.divide(lut, hi - lo, out=lut)
+    np.multiply(lut, max_out - min_out, out=lut)
+    np.add(lut, min_out, out=lut)
+    np.clip(lut, min_out, max_out, out=lut)
+    return lut.astype(np.uint8)
+
+
+def _histogram_lut(
+    hist: np.ndarray, truncated_value: float, max_out: int, min_out: int
+) -> np.ndarray:
+    """根据整数值直方图生成截断拉伸的查找表
+
+    Args:
+        hist: 直方图，hist[v] 为取值 v 的像素个数（至少包含一个像素）
+        truncated_value: 截断百分比
+        max_out: 输出的最大值
+        min_out: 输出的最小值
+
+    Returns:
+        np.ndarray: 长度与直方图相同的uint8查找表
+    """
+    # 常数影像（含全零）全部输出最小值
+    nonzero = np.flatnonzero(hist)
+    if nonzero[0] == nonzero[-1]:
+        return np.full(hist.size, min_out, dtype=np.uint8)
+
+    lo, hi = _histogram_percentiles(hist, (truncated_value, 100 - truncated_value))
+    if np.isclose(hi, lo):
+        return np.full(hist.size, (max_out + min_out) // 2, dtype=np.uint8)
+
+    return _stretch_lut(hist.size, lo, hi, max_out, min_out)
+
+
+def _apply_lut(lut: np.ndarray, values: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """按查找表映射整数影像，返回 lut[values]
+
+    二维连续的uint8影像使用OpenCV的SIMD查表（cv2.LUT），其余情况使用 np.take。
+
+    Args:
+        lut: uint8查找表，长度覆盖 values 的取值范围
+        values: 整数影像
+        out: 可选的输出数组，形状与 values 相同
+
+    Returns:
+        np.ndarray: 查表结果（提供 out 时即为 out）
+    """
+    if values.dtype == np.uint8 and values.ndim == 2 and values.flags.c_contiguous:
+        return cv2.LUT(values, lut, dst=out)
+    return np.take(lut, values, out=out)
+
+
+def _gray_process_integer(
+    gray_array: np.ndarray, truncated_value: float, max_out: int, min_out: int
+) -> np.ndarray:
+    """uint8/uint16 影像的拉伸：一次直方图统计求百分位数，再查表输出
+
+    直方图替代排序求百分位数，查表替代逐像素浮点运算，且不产生float64副本。
+    """
+    hist = np.bincount(gray_array.ravel(), minlength=256)
+    lut = _histogram_lut(hist, truncated_value, max_out, min_out)
+    return _apply_lut(lut, gray_array)
+
+
+# 可经符号位翻转走直方图快速路径的有符号整数类型 -> 同宽度的无符号类型
+_SIGNED_TO_UNSIGNED = {np.dtype(np.int8): np.uint8, np.dtype(np.int16): np.uint16}
+
+
+# 浮点等影像估计截断分位点时的目标抽样像素数，像素数不足其两倍时使用全部像素
+_PERCENTILE_SAMPLE_SIZE = 1 << 22
+
+
+# 判断浮点影像为常数时的容差（与 np.allclose 的默认 atol/rtol 一致）
+_CONSTANT_ATOL = 1e-8
+_CONSTANT_RTOL = 1e-5
+
+
 def gray_process(
     gray: Union[np.ndarray, list],
     truncated_value: float = 1,
@@ -399,26 +590,135 @@ def gray_process(
     Returns:
         np.ndarray: 处理后的8位无符号整数数组
     """
-    # 转换为numpy数组并确保是浮点类型便于计算
-    gray_array = np.asarray(gray, dtype=np.float64)
-
-    # 高效检查是否为全零或常数数组
-    if not np.any(gray_array) or np.allclose(gray_array, gray_array.flat[0]):
-        return np.full_like(gray_array, min_out, dtype=np.uint8)
-
-    # 使用numpy的向量化操作计算百分位数
-    lo, hi = np.percentile(gray_array, [truncated_value, 100 - truncated_value])
+    # 8/16位无符号整数影像（最常见的输入）走直方图+查找表的快速路径
+    gray_array = np.asarray(gray)
+    if gray_array.dtype in (np.uint8, np.uint16) and gray_array.size:
+        return _gray_process_integer(gray_array, truncated_value, max_out, min_out)
+
+    # 8/16位有符号整数翻转符号位后按大小顺序映射为无符号整数（整体平移 2^(n-1)），
+    # 截断拉伸只与相对位置有关，同样可以走直方图快速路径
+    unsigned_dtype = _SIGNED_TO_UNSIGNED.get(gray_array.dtype)
+    if unsigned_dtype is not None and gray_array.size:
+        sign_bit = 1 << (8 * gray_array.dtype.itemsize - 1)
+        shifted = np.bitwise_xor(gray_array.view(unsigned_dtype), unsigned_dtype(sign_bit))
+        return _gray_process_integer(shifted, truncated_value, max_out, min_out)
+
+    if gray_array.dtype.kind in "iu":
+        # 其余整数影像保持原始类型完成常数判断和分位数选择，不生成整幅float64副本
+        # 16位及以下的整数在float32中可精确表示，拉伸计算用float32即可（输出仅8位）
+        work_dtype = np.float32 if gray_array.dtype.itemsize <= 2 else np.float64
+    else:
+        # 转换为浮点数组便于计算；float32影像保持单精度（输出仅8位，精度足够），
+        # 免去整幅float64副本，内存读写量减半
+        work_dtype = np.float32 if gray_array.dtype == np.float32 else np.float64
+        gray_array = np.asarray(gray_array, dtype=work_dtype)
+
+    if gray_array.size == 0:
+        return np.full(gray_array.shape, min_out, dtype=np.uint8)
+
+    # 一次最值归约判断全零/常数数组，容差与 np.allclose 默认值相同，且不分配临时数组；
+    # 整数影像同样按该容差判断：数值很大（约1e5以上）时相差几个单位也视为常数
+    value_min, value_max = float(gray_array.min()), float(gray_array.max())
+    first = float(gray_array.flat[0])
+    if value_min == value_max or max(value_max - first, first - value_min) <= (
+        _CONSTANT_ATOL + _CONSTANT_RTOL * abs(first)
+    ):
+        return np.full(gray_array.shape, min_out, dtype=np.uint8)
+
+    if truncated_value == 0:
+        # 不截断时上下限即最值，无需再做选择
+        lo, hi = value_min, value_max
+    else:
+        # 只需要两个分位点，用选择算法代替完整排序；
+        # 超大影像按固定步长抽样估计分位点，截断拉伸对个别灰阶的偏差不敏感；
+        # 步长取与行宽互质的值，使抽样点均匀覆盖所有列，避免只落在少数几列上
+        flat = gray_array.ravel()
+        stride = flat.size // _PERCENTILE_SAMPLE_SIZE
+        if stride > 1:
+            row_width = gray_array.shape[-1]
+            while math.gcd(stride, row_width) != 1:
+                stride += 1
+            flat = flat[::stride]
+        lo, hi = _partition_percentiles(flat, (truncated_value, 100 - truncated_value))
 
     # 避免除零错误的自适应处理
     if np.isclose(hi, lo):
         return np.full_like(gray_array, (max_out + min_out) // 2, dtype=np.uint8)
 
-    # 使用numpy链式操作进行线性变换和裁剪
-    return np.clip(
-        (gray_array - lo) / (hi - lo) * (max_out - min_out) + min_out,
-        min_out,
-        max_out
-    ).astype(np.uint8)
+    # 线性变换和裁剪：运算顺序与查找表相同，只分配一个中间缓冲区并原地运算
+    stretched = np.subtract(gray_array, lo, dtype=work_dtype)
+    np.divide(stretched, hi - lo, out=stretched)
+    np.multiply(stretched, max_out - min_out, out=stretched)
+    np.add(stretched, min_out, out=stretched)
+    np.clip(stretched, min_out, max_out, out=stretched)
+    return stretched.astype(np.uint8)
+
+
+def _read_decimated(band: gdal.Band, factor: int) -> np.ndarray:
+    """按降采样倍数读取波段，由GDAL在读取时做均值降采样
+
+    存在内置金字塔时GDAL自动选用最接近目标尺寸的层级，无需解码全分辨率数据。
+
+    Args:
+        band: GDAL波段对象
+        factor: 降采样倍数（如2表示宽高各缩小为1/2）
+
+    Returns:
+        np.ndarray: 降采样后的数组
+    """
+    return _safe_read_array(
+        band,
+        buf_xsize=max(1, band.XSize // factor),
+        buf_ysize=max(1, band.YSize // factor),
+        resample_alg=gdal.GRIORA_Average,
+    )
+
+
+# 超过该像素数的 Byte/UInt16 影像按条带分块流式转换，每个条带约包含这么多像素
+_STREAM_STRIP_PIXELS = 1 << 24
+
+# 可按直方图流式拉伸的GDAL数据类型及其取值个数（Byte、UInt16）
+_STREAM_HISTOGRAM_SIZES = {1: 1 << 8, 2: 1 << 16}
+
+
+def _iter_strips(band: gdal.Band, width: int, height: int):
+    """按与块高度对齐的整行条带遍历波段，逐条读取以限制内存占用
+
+    Yields:
+        tuple: (起始行, 条带数组)
+    """
+    block_rows = max(1, band.GetBlockSize()[1])
+    rows = max(1, _STREAM_STRIP_PIXELS // width)
+    rows = max(block_rows, rows // block_rows * block_rows)
+    for yoff in range(0, height, rows):
+        ysize = min(rows, height - yoff)
+        yield yoff, _safe_read_array(band, 0, yoff, width, ysize)
+
+
+def _stream_gray_process(band: gdal.Band, width: int, height: int, truncated_value: float) -> np.ndarray:
+    """两遍扫描完成 Byte/UInt16 波段的截断拉伸，不把原始数据整幅读入内存
+
+    第一遍逐条带累计直方图求百分位数，第二遍逐条带查表写入uint8输出，
+    结果与 gray_process 一致。
+
+    Args:
+        band: GDAL波段（Byte或UInt16）
+        width: 影像宽度
+        height: 影像高度
+        truncated_value: 截断百分比
+
+    Returns:
+        np.ndarray: 拉伸后的8位无符号整数数组
+    """
+    hist = np.zeros(_STREAM_HISTOGRAM_SIZES[band.DataType], dtype=np.int64)
+    for _, strip in _iter_strips(band, width, height):
+        hist += np.bincount(strip.ravel(), minlength=hist.size)
+
+    lut = _histogram_lut(hist, truncated_value, max_out=255, min_out=0)
+    output = np.empty((height, width), dtype=np.uint8)
+    for yoff, strip in _iter_strips(band, width, height):
+        _apply_lut(lut, strip, out=output[yoff:yoff + strip.shape[0]])
+    return output
 
 
 def tiff2png(
@@ -426,6 +726,7 @@ def tiff2png(
     output_png: str,
     truncated_value: float = 1,
     downsample: int = 1,
+    compress_level: Optional[int] = None,
 ) -> str:
     """将TIFF文件转换为PNG格式，支持降采样
 
@@ -434,6 +735,8 @@ def tiff2png(
         output_png: 输出PNG文件路径
         truncated_value: 量化截断百分比
         downsample: 降采样倍数（>1时缩小图像）
+        compress_level: PNG压缩级别（0-9），越大文件越小但写入越慢；默认None不传参数，
+            使用OpenCV的快速预设（最快压缩级别+SUB滤波+RLE策略），通常比显式指定级别更快且文件更小
 
     Returns:
         str: 输出PNG文件路径
@@ -441,27 +744,38 @@ def tiff2png(
     Raises:
         RuntimeError: 如果文件打开或读取失败
     """
-    # 使用安全的文件打开和读取函数
+    # 使用安全的文件打开和读取函数，只读取参与转换的第一个波段
     dataset = _safe_open_dataset(input_tif)
-    array = _safe_read_array(dataset)
-
-    # 如果是多波段，取第一个波段
-    if array.ndim == 3:
-        array = array[0]
+    band = dataset.GetRasterBand(1)
 
-    # 进行灰度处理
-    processed_img = gray_process(array, truncated_value=truncated_value)
-
-    # 降采样处理
     if downsample > 1:
-        new_h = processed_img.shape[0] // downsample
-        new_w = processed_img.shape[1] // downsample
-        processed_img = cv2.resize(processed_img, (new_w, new_h), interpolation=cv2.INTER_AREA)
+        if band.GetOverviewCount() == 0:
+            warnings.warn(
+                f"{input_tif} 没有内置金字塔，降采样需要解码全分辨率数据；"
+                "可先运行 gdaladdo 构建金字塔以加速",
+                stacklevel=2,
+            )
+        array = _read_decimated(band, downsample)
+        processed_img = gray_process(array, truncated_value=truncated_value)
+    elif (
+        band.DataType in _STREAM_HISTOGRAM_SIZES
+        and dataset.RasterXSize * dataset.RasterYSize > _STREAM_STRIP_PIXELS
+    ):
+        # 大幅整数影像分条带流式处理，内存只需容纳uint8输出和单个条带
+        processed_img = _stream_gray_process(
+            band, dataset.RasterXSize, dataset.RasterYSize, truncated_value
+        )
+    else:
+        array = _safe_read_array(band)
+        # 进行灰度处理
+        processed_img = gray_process(array, truncated_value=truncated_value)
 
-    # 保存图像
-    cv2.imwrite(output_png, processed_img)
+    # 保存图像：只在显式指定压缩级别时传参，否则保留OpenCV无参数时的快速预设
+    params = [cv2.IMWRITE_PNG_COMPRESSION, compress_level] if compress_level is not None else []
+    cv2.imwrite(output_png, processed_img, params)
     dataset = None  # 释放资源
 
+    _forget_missing_file(output_png)
     return output_png
 
 
@@ -489,46 +803,43 @@ def cutiff(
     Raises:
         RuntimeError: 如果文件操作失败
     """
-    # 安全打开和读取数据
     dataset = _safe_open_dataset(input_tif)
-    cut_array = _safe_read_array(dataset, xoff, yoff, xsize, ysize)
 
-    # 获取地理信息
-    geotransform = dataset.GetGeoTransform()
-    projection = dataset.GetProjection()
-
-    # 计算新的地理变换参数
-    new_geotransform = (
-        geotransform[0] + xoff * geotransform[1],
-        geotransform[1],
-        geotransform[2],
-        geotransform[3] + yoff * geotransform[5],
-        geotransform[4],
-        geotransform[5],
-    )
+    # Translate 对越界窗口会自动填充，这里保持与直接读取相同的越界报错
+    if (
+        xoff < 0
+        or yoff < 0
+        or xsize <= 0
+        or ysize <= 0
+        or xoff + xsize > dataset.RasterXSize
+        or yoff + ysize > dataset.RasterYSize
+    ):
+        raise RuntimeError(
+            f"裁切范围超出图像边界: ({xoff}, {yoff}, {xsize}, {ysize})，"
+            f"图像尺寸 {dataset.RasterXSize}x{dataset.RasterYSize}"
+        )
 
-    # 创建输出数据集
-    driver = gdal.GetDriverByName("GTiff")
-    output_dataset = driver.Create(
-        output_tif, xsize, ysize, dataset.RasterCount, dataset.GetRasterBand(1).DataType
+    # 由GDAL直接完成窗口复制，地理变换、投影、无效值等元数据随之更新/保留，
+    # 数据不经过Python端的整块读取与回写
+    creation_options = ["TILED=YES", "COMPRESS=LZW", "NUM_THREADS=ALL_CPUS"]
+    if dataset.GetRasterBand(1).GetOverviewCount() > 0:
+        # 源文件带金字塔时一并复制对应窗口的金字塔，裁切结果无需重新构建
+        creation_options.append("COPY_SRC_OVERVIEWS=YES")
+    output_dataset = gdal.Translate(
+        output_tif,
+        dataset,
+        format="GTiff",
+        srcWin=[xoff, yoff, xsize, ysize],
+        creationOptions=creation_options,
     )
+    if output_dataset is None:
+        raise RuntimeError(f"无法写入文件: {output_tif}")
 
-    # 写入数据
-    if dataset.RasterCount == 1:
-        output_dataset.GetRasterBand(1).WriteArray(cut_array)
-    else:
-        for i in range(dataset.RasterCount):
-            output_dataset.GetRasterBand(i + 1).WriteArray(cut_array[i])
-
-    # 设置地理信息
-    output_dataset.SetGeoTransform(new_geotransform)
-    output_dataset.SetProjection(projection)
-    output_dataset.FlushCache()
-
-    # 释放资源
+    # 释放资源（关闭时写出数据）
     output_dataset = None
     dataset = None
 
+    _forget_missing_file(output_tif)
     return output_tif
 
 
@@ -536,6 +847,42 @@ def cutiff(
 # 数据分析模块
 # ===========================
 
+# GDAL数据类型编号 -> (类型名称, 描述, 数值范围, 内存占用)
+_GDAL_DTYPE_INFO = {
+    1: ("Byte", "8位无符号整数", "0-255", "1 byte/pixel"),
+    2: ("UInt16", "16位无符号整数", "0-65,535", "2 bytes/pixel"),
+    3: ("Int16", "16位有符号整数", "-32,768 到 32,767", "2 bytes/pixel"),
+    4: ("UInt32", "32位无符号整数", "0-4,294,967,295", "4 bytes/pixel"),
+    5: ("Int32", "32位有符号整数", "-2,147,483,648 到 2,147,483,647", "4 bytes/pixel"),
+    6: ("Float32", "32位浮点数", "IEEE 754 单精度", "4 bytes/pixel"),
+    7: ("Float64", "64位浮点数", "IEEE 754 双精度", "8 bytes/pixel"),
+    8: ("CInt16", "复数16位整数", "复数对", "4 bytes/pixel"),
+    9: ("CInt32", "复数32位整数", "复数对", "8 bytes/pixel"),
+    10: ("CFloat32", "复数32位浮点", "复数对", "8 bytes/pixel"),
+    11: ("CFloat64", "复数64位浮点", "复数对", "16 bytes/pixel"),
+}
+_UNKNOWN_DTYPE_INFO = ("Unknown", "未知类型", "未知", "未知")
+
+# GDAL数据类型编号 -> 每像素字节数
+_GDAL_DTYPE_BYTES = {1: 1, 2: 2, 3: 2, 4: 4, 5: 4, 6: 4, 7: 8, 8: 4, 9: 8, 10: 8, 11: 16}
+
+# GDAL数据类型编号 -> 显示用的中英文描述
+_GDAL_DTYPE_MAP = {
+    0: "Unknown (未知)",
+    1: "Byte (8-bit unsigned integer, 无符号8位整数)",
+    2: "UInt16 (16-bit unsigned integer, 无符号16位整数)",
+    3: "Int16 (16-bit signed integer, 有符号16位整数)",
+    4: "UInt32 (32-bit unsigned integer, 无符号32位整数)",
+    5: "Int32 (32-bit signed integer, 有符号32位整数)",
+    6: "Float32 (32-bit floating point, 32位浮点数)",
+    7: "Float64 (64-bit floating point, 64位浮点数)",
+    8: "CInt16 (Complex Int16, 复数16位整数)",
+    9: "CInt32 (Complex Int32, 复数32位整数)",
+    10: "CFloat32 (Complex Float32, 复数32位浮点数)",
+    11: "CFloat64 (Complex Float64, 复数64位浮点数)",
+}
+
+
 def _get_datatype_info(datatype: int) -> Tuple[str, str, str, str]:
     """获取GDAL数据类型的详细信息
 
@@ -545,20 +892,7 @@ def _get_datatype_info(datatype: int) -> Tuple[str, str, str, str]:
     Returns:
         tuple: (类型名称, 描述, 数值范围, 内存占用)
     """
-    datatype_map = {
-        1: ("Byte", "8位无符号整数", "0-255", "1 byte/pixel"),
-        2: ("UInt16", "16位无符号整数", "0-65,535", "2 bytes/pixel"),
-        3: ("Int16", "16位有符号整数", "-32,768 到 32,767", "2 bytes/pixel"),
-        4: ("UInt32", "32位无符号整数", "0-4,294,967,295", "4 bytes/pixel"),
-        5: ("Int32", "32位有符号整数", "-2,147,483,648 到 2,147,483,647", "4 bytes/pixel"),
-        6: ("Float32", "32位浮点数", "IEEE 754 单精度", "4 bytes/pixel"),
-        7: ("Float64", "64位浮点数", "IEEE 754 双精度", "8 bytes/pixel"),
-        8: ("CInt16", "复数16位整数", "复数对", "4 bytes/pixel"),
-        9: ("CInt32", "复数32位整数", "复数对", "8 bytes/pixel"),
-        10: ("CFloat32", "复数32位浮点", "复数对", "8 bytes/pixel"),
-        11: ("CFloat64", "复数64位浮点", "复数对", "16 bytes/pixel"),
-    }
-    return datatype_map.get(datatype, ("Unknown", "未知类型", "未知", "未知"))
+    return _GDAL_DTYPE_INFO.get(datatype, _UNKNOWN_DTYPE_INFO)
 
 
 def _get_bytes_per_pixel(datatype: int) -> int:
@@ -570,8 +904,28 @@ def _get_bytes_per_pixel(datatype: int) -> int:
     Returns:
         int: 每像素字节数
     """
-    bytes_map = {1: 1, 2: 2, 3: 2, 4: 4, 5: 4, 6: 4, 7: 8, 8: 4, 9: 8, 10: 8, 11: 16}
-    return bytes_map.get(datatype, 1)
+    return _GDAL_DTYPE_BYTES.get(datatype, 1)
+
+
+# 不存在文件的负缓存有效期（秒）、最大条目数，以及 路径 -> 确认不存在的时刻
+_MISSING_FILE_TTL = 1.0
+_MISSING_FILE_CACHE_SIZE = 4096
+_missing_files: Dict[str, float] = {}
+
+
+def _forget_missing_file(file_path: str):
+    """本模块写出文件后清除其负缓存记录，紧接着的文件信息查询能立即看到新文件"""
+    _missing_files.pop(file_path, None)
+
+
+@functools.lru_cache(maxsize=1024)
+def _local_datetime(timestamp: float) -> datetime.datetime:
+    """时间戳转本地时间（datetime不可变，同一时间戳的转换结果可直接复用）
+
+    同一次分析中文件信息与TIFF信息使用相同的 stat 结果，
+    重复分析未变化的文件时时间戳也不变，都无需重复转换。
+    """
+    return datetime.datetime.fromtimestamp(timestamp)
 
 
 def _get_file_info(file_path: str) -> Optional[Dict[str, Any]]:
@@ -583,29 +937,204 @@ def _get_file_info(file_path: str) -> Optional[Dict[str, Any]]:
     Returns:
         dict: 文件信息字典，如果文件不存在返回None
     """
-    if not os.path.exists(file_path):
+    # 短时间内确认过不存在的路径直接返回，避免在网络文件系统上反复 stat
+    missing_since = _missing_files.get(file_path)
+    if missing_since is not None and time.monotonic() - missing_since < _MISSING_FILE_TTL:
+        return None
+
+    # 直接 stat 一次，不存在时返回None（先判断存在再 stat 会多一次系统调用且存在竞态）
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        if len(_missing_files) >= _MISSING_FILE_CACHE_SIZE:
+            # 条目数量有上限，满了直接整体丢弃（记录本身很快过期）
+            _missing_files.clear()
+        _missing_files[file_path] = time.monotonic()
         return None
+    except OSError:
+        return None
+    _missing_files.pop(file_path, None)
+    return _file_info_from_stat(stat)
+
 
-    stat = os.stat(file_path)
+def _file_info_from_stat(stat: os.stat_result) -> Dict[str, Any]:
+    """由 os.stat 结果构建文件信息字典"""
     return {
         "size_bytes": stat.st_size,
         "size_mb": stat.st_size / (1024 * 1024),
-        "created_time": datetime.datetime.fromtimestamp(stat.st_ctime),
-        "modified_time": datetime.datetime.fromtimestamp(stat.st_mtime),
-        "accessed_time": datetime.datetime.fromtimestamp(stat.st_atime),
+        "created_time": _local_datetime(stat.st_ctime),
+        "modified_time": _local_datetime(stat.st_mtime),
+        "accessed_time": _local_datetime(stat.st_atime),
     }
 
 
-def tiffinfo(input_tif: str) -> Dict[str, Any]:
-    """查看详细TIFF图像信息
+# PNG文件签名与IHDR颜色类型 -> 模式名称（与PIL的命名一致）
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_COLOR_MODES = {0: "L", 2: "RGB", 3: "P", 4: "LA", 6: "RGBA"}
+
+
+def _read_png_header(png_path: str) -> Dict[str, Any]:
+    """直接解析PNG文件头（IHDR块）获取尺寸和模式，无需解码图像
+
+    Args:
+        png_path: PNG文件路径
+
+    Returns:
+        dict: 包含尺寸、模式、格式和位深的字典
+
+    Raises:
+        ValueError: 如果文件不是有效的PNG
+    """
+    # 签名(8) + 块长度(4) + 块类型(4) + 宽(4) + 高(4) + 位深(1) + 颜色类型(1)
+    with open(png_path, "rb") as f:
+        header = f.read(26)
+    if len(header) < 26:
+        raise ValueError(f"不是有效的PNG文件: {png_path}")
+
+    signature, _, chunk_type, width, height, bit_depth, color_type = struct.unpack(
+        ">8sI4sIIBB", header
+    )
+    if signature != _PNG_SIGNATURE or chunk_type != b"IHDR":
+        raise ValueError(f"不是有效的PNG文件: {png_path}")
+
+    mode = _PNG_COLOR_MODES.get(color_type, "未知")
+    if color_type == 0 and bit_depth == 1:
+        mode = "1"
+    elif color_type == 0 and bit_depth == 16:
+        mode = "I;16"
+
+    return {
+        "size": (width, height),
+        "mode": mode,
+        "format": "PNG",
+        "bit_depth": bit_depth,
+        # 只读取文件头，不解析附加数据块
+        "info": {},
+    }
 
-    使用重构后的辅助函数，提高代码复用性和可维护性
+
+# 并行计算各波段统计信息的最大线程数
+_BAND_STATS_MAX_WORKERS = 8
+
+
+def _band_info(
+    band: gdal.Band, band_number: int, compute_stats: bool, with_metadata: bool = True
+) -> Dict[str, Any]:
+    """获取单个波段的详细信息
+
+    Args:
+        band: GDAL波段对象
+        band_number: 波段序号（从1开始）
+        compute_stats: 缺少统计信息时是否扫描像素计算
+        with_metadata: 是否读取波段元数据，为False时 Metadata 为None
+
+    Returns:
+        dict: 波段信息字典
+    """
+    band_stats = _get_band_statistics(band, compute_stats)
+    return {
+        "BandNumber": band_number,
+        "DataType": band.DataType,
+        "MinValue": band_stats["MinValue"],
+        "MaxValue": band_stats["MaxValue"],
+        "MeanValue": band_stats["MeanValue"],
+        "StdDev": band_stats["StdDev"],
+        "NoDataValue": band.GetNoDataValue(),
+        "ColorInterpretation": band.GetColorInterpretation(),
+        "Metadata": band.GetMetadata() if with_metadata else None,
+    }
+
+
+def _band_info_in_own_handle(
+    input_tif: str, band_number: int, compute_stats: bool, with_metadata: bool = True
+) -> Dict[str, Any]:
+    """在独立打开的数据集上获取波段信息（同一个 gdal.Dataset 不能被多个线程并发读取）
+
+    工作句柄在当前线程内关闭PAM：多个句柄关闭时不会竞争写同一个 .aux.xml，
+    计算结果由调用方写回主句柄统一持久化。
+    """
+    with gdal.config_option("GDAL_PAM_ENABLED", "NO", thread_local=True):
+        dataset = _safe_open_dataset(input_tif)
+        try:
+            return _band_info(dataset.GetRasterBand(band_number), band_number, compute_stats, with_metadata)
+        finally:
+            dataset = None
+
+
+def _collect_band_info(
+    dataset: gdal.Dataset, input_tif: str, compute_stats: bool, with_metadata: bool = True
+) -> List[Dict[str, Any]]:
+    """获取所有波段的详细信息
+
+    先在主句柄上读取已缓存的统计信息；需要扫描像素计算统计的波段多于一个时，
+    这些波段在线程池中并行计算（GDAL计算统计时释放GIL），每个线程使用独立的
+    数据集句柄，结果只通过主句柄持久化。
+
+    Args:
+        dataset: 已打开的GDAL数据集
+        input_tif: 数据集文件路径，用于在工作线程中重新打开
+        compute_stats: 缺少统计信息时是否扫描像素计算
+        with_metadata: 是否读取各波段元数据
+
+    Returns:
+        list: 按波段顺序排列的波段信息列表
+    """
+    band_count = dataset.RasterCount
+    if not compute_stats or band_count <= 1:
+        return [
+            _band_info(dataset.GetRasterBand(i), i, compute_stats, with_metadata)
+            for i in range(1, band_count + 1)
+        ]
+
+    # 已有缓存统计（文件内或PAM）的波段直接在主句柄上读取，只有缺少统计的波段需要计算
+    band_info_list = [
+        _band_info(dataset.GetRasterBand(i), i, False, with_metadata)
+        for i in range(1, band_count + 1)
+    ]
+    missing = [info["BandNumber"] for info in band_info_list if info["StdDev"] is None]
+    if len(missing) <= 1:
+        for band_number in missing:
+            band_info_list[band_number - 1] = _band_info(
+                dataset.GetRasterBand(band_number), band_number, True, with_metadata
+            )
+        return band_info_list
+
+    workers = min(_BAND_STATS_MAX_WORKERS, len(missing))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        computed = list(
+            executor.map(
+                _band_info_in_own_handle,
+                [input_tif] * len(missing),
+                missing,
+                [True] * len(missing),
+                [with_metadata] * len(missing),
+            )
+        )
+
+    # 工作句柄不写PAM，把结果写回主句柄，关闭时统一持久化到 .aux.xml
+    for band_info in computed:
+        band_number = band_info["BandNumber"]
+        band_info_list[band_number - 1] = band_info
+        if band_info["StdDev"] is not None:
+            dataset.GetRasterBand(band_number).SetStatistics(
+                band_info["MinValue"],
+                band_info["MaxValue"],
+                band_info["MeanValue"],
+                band_info["StdDev"],
+            )
+    return band_info_list
+
+
+def _raster_info(input_tif: str, compute_stats: bool = True, with_metadata: bool = True) -> Dict[str, Any]:
+    """从GDAL数据集读取栅格、地理与波段信息（不含文件系统信息）
 
     Args:
         input_tif: 输入TIFF文件路径
+        compute_stats: 是否在缺少统计信息时扫描像素计算各波段统计值
+        with_metadata: 是否读取数据集及各波段的元数据
 
     Returns:
-        dict: 详细图像信息字典
+        dict: 栅格信息字典
 
     Raises:
         RuntimeError: 如果无法打开文件
@@ -613,12 +1142,10 @@ def tiffinfo(input_tif: str) -> Dict[str, Any]:
     # 安全打开数据集
     dataset = _safe_open_dataset(input_tif)
 
-    # 获取基本统计信息
+    # 获取每个波段的详细信息，第一波段的记录同时提供基本统计信息
     first_band = dataset.GetRasterBand(1)
-    first_band_stats = _get_band_statistics(first_band)
-
-    # 获取文件系统信息
-    file_stat = os.stat(input_tif)
+    band_info_list = _collect_band_info(dataset, input_tif, compute_stats, with_metadata)
+    first_band_stats = band_info_list[0]
 
     # 获取地理坐标转换信息
     geotransform = dataset.GetGeoTransform()
@@ -629,14 +1156,7 @@ def tiffinfo(input_tif: str) -> Dict[str, Any]:
         geotransform, projection, dataset.RasterXSize, dataset.RasterYSize
     )
 
-    # 构建基本信息字典
     info: Dict[str, Any] = {
-        # 基本信息
-        "FilePath": input_tif,
-        "FileName": os.path.basename(input_tif),
-        "FileSize": file_stat.st_size,
-        "CreationTime": datetime.datetime.fromtimestamp(file_stat.st_ctime),
-        "ModificationTime": datetime.datetime.fromtimestamp(file_stat.st_mtime),
         # 栅格信息
         "RasterXSize": dataset.RasterXSize,
         "RasterYSize": dataset.RasterYSize,
@@ -657,34 +1177,118 @@ def tiffinfo(input_tif: str) -> Dict[str, Any]:
         "MeanValue": first_band_stats["MeanValue"],
         "StdDev": first_band_stats["StdDev"],
         # 波段信息
-        "BandInfo": [],
+        "BandInfo": band_info_list,
         # 元数据
-        "Metadata": dataset.GetMetadata(),
+        "Metadata": dataset.GetMetadata() if with_metadata else None,
     }
 
-    # 获取每个波段的详细信息
-    for i in range(1, dataset.RasterCount + 1):
-        band = dataset.GetRasterBand(i)
-        band_stats = _get_band_statistics(band)
-        band_info = {
-            "BandNumber": i,
-            "DataType": band.DataType,
-            "MinValue": band_stats["MinValue"],
-            "MaxValue": band_stats["MaxValue"],
-            "MeanValue": band_stats["MeanValue"],
-            "StdDev": band_stats["StdDev"],
-            "NoDataValue": band.GetNoDataValue(),
-            "ColorInterpretation": band.GetColorInterpretation(),
-            "Metadata": band.GetMetadata(),
-        }
-        band_info_list = info["BandInfo"]
-        if isinstance(band_info_list, list):
-            band_info_list.append(band_info)
-
     dataset = None  # 释放资源
     return info
 
 
+def _merge_file_stat(input_tif: str, file_stat: os.stat_result, raster_info: Dict[str, Any]) -> Dict[str, Any]:
+    """把文件系统信息与栅格信息合并为 tiffinfo 的结果字典（文件信息在前）"""
+    return {
+        # 基本信息
+        "FilePath": input_tif,
+        "FileName": os.path.basename(input_tif),
+        "FileSize": file_stat.st_size,
+        "CreationTime": _local_datetime(file_stat.st_ctime),
+        "ModificationTime": _local_datetime(file_stat.st_mtime),
+        **raster_info,
+    }
+
+
+def tiffinfo(
+    input_tif: str,
+    compute_stats: bool = True,
+    file_stat: Optional[os.stat_result] = None,
+    with_metadata: bool = True,
+) -> Dict[str, Any]:
+    """查看详细TIFF图像信息
+
+    使用重构后的辅助函数，提高代码复用性和可维护性
+
+    Args:
+        input_tif: 输入TIFF文件路径
+        compute_stats: 是否在缺少统计信息时扫描像素计算各波段统计值；
+            为False时仅使用已缓存的统计信息，避免大文件的全量扫描
+        file_stat: 调用方已获取的 os.stat 结果，提供时不再重复 stat 文件
+        with_metadata: 是否读取数据集及各波段的元数据；不需要时传False，
+            可避免部分驱动额外探测辅助文件，Metadata 字段为None
+
+    Returns:
+        dict: 详细图像信息字典；同一文件未变化时栅格部分来自缓存，
+            返回的是缓存的副本，调用方可以自由修改
+
+    Raises:
+        RuntimeError: 如果无法打开文件
+    """
+    # 获取文件系统信息
+    if file_stat is None:
+        try:
+            file_stat = os.stat(input_tif)
+        except OSError:
+            # 交由GDAL抛出统一的打开失败异常
+            _raster_info(input_tif, compute_stats, with_metadata)
+            raise
+    return _cached_tiffinfo(input_tif, file_stat, compute_stats, with_metadata)
+
+
+def tiffinfo_fast(input_tif: str) -> Dict[str, Any]:
+    """只读取元数据的 tiffinfo：不扫描像素计算统计，只返回文件中已缓存的统计信息
+
+    Args:
+        input_tif: 输入TIFF文件路径
+
+    Returns:
+        dict: 详细图像信息字典（无缓存统计时各统计值为None）
+    """
+    return tiffinfo(input_tif, compute_stats=False)
+
+
+# 栅格信息缓存的最大条目数
+_RASTER_INFO_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=_RASTER_INFO_CACHE_SIZE)
+def _cached_raster_info(
+    abs_path: str, mtime_ns: int, size: int, compute_stats: bool = True, with_metadata: bool = True
+) -> Dict[str, Any]:
+    """按 (绝对路径, 修改时间, 文件大小, 是否计算统计, 是否读取元数据) 缓存栅格信息
+
+    文件被改写后修改时间或大小随之变化，自然不会命中旧结果。
+    返回的字典在多次调用间共享，调用方不应修改。
+    """
+    return _raster_info(abs_path, compute_stats, with_metadata)
+
+
+def _cached_tiffinfo(
+    input_tif: str, file_stat: os.stat_result, compute_stats: bool = True, with_metadata: bool = True
+) -> Dict[str, Any]:
+    """使用已获取的 stat 结果组装 tiffinfo，栅格部分按文件修改时间和大小缓存
+
+    缓存的栅格信息深拷贝后再交给调用方，调用方修改结果（如 BandInfo、Metadata）
+    不会影响之后对同一文件的调用。
+    """
+    raster_info = _cached_raster_info(
+        os.path.abspath(input_tif), file_stat.st_mtime_ns, file_stat.st_size, compute_stats, with_metadata
+    )
+    return _merge_file_stat(input_tif, file_stat, copy.deepcopy(raster_info))
+
+
+@functools.lru_cache(maxsize=256)
+def _format_bounds_cached(w: float, e: float, s: float, n: float) -> str:
+    """按四至数值缓存格式化结果（非负为东经/北纬，负值为西经/南纬）"""
+    return f"{abs(w):.6f}°{'WE'[w >= 0]} - {abs(e):.6f}°{'WE'[e >= 0]}, {abs(s):.6f}°{'SN'[s >= 0]} - {abs(n):.6f}°{'SN'[n >= 0]}"
+
+
+@functools.lru_cache(maxsize=256)
+def _format_center_cached(lon: float, lat: float) -> str:
+    """按经纬度数值缓存格式化结果"""
+    return f"{abs(lon):.6f}°{'WE'[lon >= 0]}, {abs(lat):.6f}°{'SN'[lat >= 0]}"
+
+
 def format_coordinate_bounds(bounds: Optional[Dict[str, float]]) -> Optional[str]:
     """格式化地理边界信息
 
@@ -697,12 +1301,7 @@ def format_coordinate_bounds(bounds: Optional[Dict[str, float]]) -> Optional[str
     if not bounds:
         return None
 
-    west_dir = "W" if bounds["west"] < 0 else "E"
-    east_dir = "E" if bounds["east"] >= 0 else "W"
-    south_dir = "S" if bounds["south"] < 0 else "N"
-    north_dir = "N" if bounds["north"] >= 0 else "S"
-
-    return f"{abs(bounds['west']):.6f}°{west_dir} - {abs(bounds['east']):.6f}°{east_dir}, {abs(bounds['south']):.6f}°{south_dir} - {abs(bounds['north']):.6f}°{north_dir}"
+    return _format_bounds_cached(bounds["west"], bounds["east"], bounds["south"], bounds["north"])
 
 
 def format_coordinate_center(center: Optional[Dict[str, float]]) -> Optional[str]:
@@ -717,31 +1316,106 @@ def format_coordinate_center(center: Optional[Dict[str, float]]) -> Optional[str
     if not center:
         return None
 
-    lon_dir = "E" if center["longitude"] >= 0 else "W"
-    lat_dir = "N" if center["latitude"] >= 0 else "S"
+    return _format_center_cached(center["longitude"], center["latitude"])
 
-    return f"{abs(center['longitude']):.6f}°{lon_dir}, {abs(center['latitude']):.6f}°{lat_dir}"
 
+# 地球平均半径（千米）
+_EARTH_RADIUS_KM = 6371.0
 
-def calculate_projected_distance_and_area(info: Dict[str, Any]) -> Dict[str, Any]:
-    """基于投影坐标系计算距离和面积
+
+@functools.lru_cache(maxsize=256)
+def _approx_span_km(west: float, east: float, south: float, north: float) -> Tuple[float, float]:
+    """用Haversine公式估算经纬度范围的东西/南北跨度
+
+    东西跨度沿中心纬线计算，南北跨度沿经线计算，比按"1度≈111km"
+    做余弦修正的近似更准确，且大跨度时同样适用。
+    按边界数值缓存，重复分析同一影像时无需再做三角函数运算。
 
     Args:
-        info: TIFF信息字典，包含投影和地理变换信息
+        west: 西边界经度
+        east: 东边界经度
+        south: 南边界纬度
+        north: 北边界纬度
 
     Returns:
-        dict: 包含距离和面积信息的字典
+        tuple: (东西跨度千米, 南北跨度千米)
+    """
+    lat_center = math.radians((north + south) / 2)
+    half_dlon = math.radians(east - west) / 2
+    half_dlat = math.radians(north - south) / 2
+
+    # a = sin²(Δφ/2) + cosφ1·cosφ2·sin²(Δλ/2)，沿纬线时 Δφ=0，沿经线时 Δλ=0
+    a_x = (math.cos(lat_center) * math.sin(half_dlon)) ** 2
+    a_y = math.sin(half_dlat) ** 2
+    x_span_km = 2 * _EARTH_RADIUS_KM * math.atan2(math.sqrt(a_x), math.sqrt(1 - a_x))
+    y_span_km = 2 * _EARTH_RADIUS_KM * math.atan2(math.sqrt(a_y), math.sqrt(1 - a_y))
+    return x_span_km, y_span_km
+
+
+def _approx_span_km_array(
+    west: np.ndarray, east: np.ndarray, south: np.ndarray, north: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """_approx_span_km 的向量化版本，一次计算多组经纬度范围的跨度
+
+    Args:
+        west: 西边界经度数组
+        east: 东边界经度数组
+        south: 南边界纬度数组
+        north: 北边界纬度数组
+
+    Returns:
+        tuple: (东西跨度千米数组, 南北跨度千米数组)
+    """
+    cos_lat = np.cos(np.radians((north + south) / 2))
+    a_x = np.square(cos_lat * np.sin(np.radians(east - west) / 2))
+    a_y = np.square(np.sin(np.radians(north - south) / 2))
+    x_span_km = 2 * _EARTH_RADIUS_KM * np.arctan2(np.sqrt(a_x), np.sqrt(1 - a_x))
+    y_span_km = 2 * _EARTH_RADIUS_KM * np.arctan2(np.sqrt(a_y), np.sqrt(1 - a_y))
+    return x_span_km, y_span_km
+
+
+def _unknown_distance_area() -> Dict[str, Any]:
+    """无法计算距离面积时的结果"""
+    return {
+        "x_span_km": None,
+        "y_span_km": None,
+        "area_km2": None,
+        "unit_name": "未知单位",
+    }
+
+
+def _approx_distance_area(
+    x_span_km: float, y_span_km: float, extent: Tuple[float, float, float]
+) -> Dict[str, Any]:
+    """由经纬度近似跨度组装距离面积结果"""
+    x_span, y_span, area = extent
+    return {
+        "x_span_km": x_span_km,
+        "y_span_km": y_span_km,
+        "area_km2": x_span_km * y_span_km,
+        "unit_name": "度 (近似计算)",
+        "unit_to_meter": None,
+        "x_span_original": x_span,
+        "y_span_original": y_span,
+        "area_original": area,
+    }
+
+
+def _projected_distance_area(
+    info: Dict[str, Any]
+) -> Tuple[Optional[Dict[str, Any]], Optional[Tuple[float, float, float]]]:
+    """按投影单位计算距离面积
+
+    Returns:
+        tuple: (结果字典, 投影范围)。结果字典为None而投影范围不为None时，
+            表示坐标系单位未知，需要改用经纬度近似计算
     """
     geotransform = info.get("GeoTransform")
     projection = info.get("Projection")
 
-    if not geotransform or not projection:
-        return {
-            "x_span_km": None,
-            "y_span_km": None,
-            "area_km2": None,
-            "unit_name": "未知单位",
-        }
+    # 没有地理参考时距离面积无意义，也无需解析投影
+    if not geotransform or not projection or tuple(geotransform) == _IDENTITY_GEOTRANSFORM:
+        return _unknown_distance_area(), None
 
     # 计算投影坐标系的范围
     width = info["RasterXSize"]
@@ -757,62 +1431,82 @@ def calculate_projected_distance_and_area(info: Dict[str, Any]) -> Dict[str, Any
     area = x_span * y_span
 
     # 获取投影坐标系的单位信息
-    try:
-        srs = osr.SpatialReference()
-        srs.ImportFromWkt(projection)
+    unit_name, unit_to_meter, unit_to_km, unit_to_km2 = _srs_units(projection)
 
-        # 获取线性单位
-        unit_name = srs.GetLinearUnitsName()
-        unit_to_meter = srs.GetLinearUnits()
-
-        # 将距离和面积转换为千米和平方千米
-        x_span_km = (x_span * unit_to_meter) / 1000.0
-        y_span_km = (y_span * unit_to_meter) / 1000.0
-        area_km2 = (area * unit_to_meter * unit_to_meter) / 1000000.0
-
-        return {
-            "x_span_km": x_span_km,
-            "y_span_km": y_span_km,
-            "area_km2": area_km2,
-            "unit_name": unit_name or "未知单位",
-            "unit_to_meter": unit_to_meter,
-            "x_span_original": x_span,
-            "y_span_original": y_span,
-            "area_original": area,
-        }
+    if unit_to_meter is None:
+        return None, (x_span, y_span, area)
 
-    except Exception:
-        # 如果无法获取单位信息，使用地理坐标计算近似值
-        if info.get("GeographicBounds"):
-            bounds = info["GeographicBounds"]
-            # 使用地理坐标的近似距离计算（赤道附近1度约等于111km）
-            lat_center = (bounds["north"] + bounds["south"]) / 2
-            lon_span = abs(bounds["east"] - bounds["west"])
-            lat_span = abs(bounds["north"] - bounds["south"])
-
-            # 考虑纬度的cos修正
-            cos_lat = math.cos(math.radians(lat_center))
-            x_span_km = lon_span * 111.0 * cos_lat
-            y_span_km = lat_span * 111.0
-            area_km2 = x_span_km * y_span_km
-
-            return {
-                "x_span_km": x_span_km,
-                "y_span_km": y_span_km,
-                "area_km2": area_km2,
-                "unit_name": "度 (近似计算)",
-                "unit_to_meter": None,
-                "x_span_original": x_span,
-                "y_span_original": y_span,
-                "area_original": area,
-            }
-
-        return {
-            "x_span_km": None,
-            "y_span_km": None,
-            "area_km2": None,
-            "unit_name": "未知单位",
-        }
+    # 将距离和面积转换为千米和平方千米
+    return {
+        "x_span_km": x_span * unit_to_km,
+        "y_span_km": y_span * unit_to_km,
+        "area_km2": area * unit_to_km2,
+        "unit_name": unit_name or "未知单位",
+        "unit_to_meter": unit_to_meter,
+        "x_span_original": x_span,
+        "y_span_original": y_span,
+        "area_original": area,
+    }, None
+
+
+def calculate_projected_distance_and_area(info: Dict[str, Any]) -> Dict[str, Any]:
+    """基于投影坐标系计算距离和面积
+
+    Args:
+        info: TIFF信息字典，包含投影和地理变换信息
+
+    Returns:
+        dict: 包含距离和面积信息的字典
+    """
+    result, extent = _projected_distance_area(info)
+    if result is not None:
+        return result
+
+    # 如果无法获取单位信息，使用地理坐标计算近似值
+    bounds = info.get("GeographicBounds")
+    if bounds:
+        x_span_km, y_span_km = _approx_span_km(
+            bounds["west"], bounds["east"], bounds["south"], bounds["north"]
+        )
+        return _approx_distance_area(x_span_km, y_span_km, extent)
+
+    return _unknown_distance_area()
+
+
+def calculate_projected_distance_and_area_batch(infos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """批量计算多个TIFF的距离和面积，结果与逐个调用 calculate_projected_distance_and_area 相同
+
+    需要经纬度近似计算的条目汇总为 (N, 4) 的边界数组，一次向量化计算全部跨度。
+
+    Args:
+        infos: TIFF信息字典列表
+
+    Returns:
+        list: 与 infos 一一对应的距离面积信息字典
+    """
+    results: List[Optional[Dict[str, Any]]] = []
+    pending = []
+    for index, info in enumerate(infos):
+        result, extent = _projected_distance_area(info)
+        if result is None:
+            bounds = info.get("GeographicBounds")
+            if bounds:
+                pending.append((index, extent, bounds))
+            else:
+                result = _unknown_distance_area()
+        results.append(result)
+
+    if pending:
+        edges = np.array(
+            [[b["west"], b["east"], b["south"], b["north"]] for _, _, b in pending], dtype=np.float64
+        )
+        x_spans_km, y_spans_km = _approx_span_km_array(*edges.T)
+        for (index, extent, _), x_span_km, y_span_km in zip(
+            pending, x_spans_km.tolist(), y_spans_km.tolist()
+        ):
+            results[index] = _approx_distance_area(x_span_km, y_span_km, extent)
+
+    return results
 
 
 def get_file_info(file_path: str) -> Optional[Dict[str, Any]]:
@@ -827,20 +1521,32 @@ def get_file_info(file_path: str) -> Optional[Dict[str, Any]]:
     return _get_file_info(file_path)
 
 
-def analyze_tiff_comprehensive(file_path: str) -> Dict[str, Any]:
+# 按纵横比与1的比较结果（小于/等于/大于）索引的图像方向
+_ASPECT_TYPES = ("竖版", "正方形", "横版")
+
+
+def analyze_tiff_comprehensive(
+    file_path: str, compute_stats: bool = True, with_metadata: bool = True
+) -> Dict[str, Any]:
     """综合分析TIFF文件，返回结构化数据
 
     Args:
         file_path: TIFF文件路径
+        compute_stats: 是否计算波段统计信息（见 tiffinfo）
+        with_metadata: 是否读取元数据（见 tiffinfo）
 
     Returns:
         dict: 包含完整分析结果的字典
     """
-    # 获取文件基本信息
-    file_info = get_file_info(file_path)
+    # 只 stat 一次文件，文件信息与TIFF信息共用同一结果
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        file_stat = None
+    file_info = _file_info_from_stat(file_stat) if file_stat is not None else None
 
-    # 获取TIFF信息
-    tiff_info = tiffinfo(file_path)
+    # 同一文件未变化时复用已解析的栅格信息，避免重复打开和统计
+    tiff_info = tiffinfo(file_path, compute_stats, file_stat, with_metadata)
 
     # 计算距离面积信息
     distance_area = calculate_projected_distance_and_area(tiff_info)
@@ -849,18 +1555,20 @@ def analyze_tiff_comprehensive(file_path: str) -> Dict[str, Any]:
     bounds_str = format_coordinate_bounds(tiff_info.get("GeographicBounds"))
     center_str = format_coordinate_center(tiff_info.get("GeographicCenter"))
 
-    # 计算总像素数
-    total_pixels = tiff_info["RasterXSize"] * tiff_info["RasterYSize"]
+    # 栅格尺寸与类型只取一次
+    width = tiff_info["RasterXSize"]
+    height = tiff_info["RasterYSize"]
+    datatype = tiff_info["DataType"]
 
-    # 计算纵横比
-    aspect_ratio = tiff_info["RasterXSize"] / tiff_info["RasterYSize"]
+    # 计算总像素数与纵横比
+    total_pixels = width * height
+    aspect_ratio = width / height
 
     # 获取数据类型信息
-    datatype_info = _get_datatype_info(tiff_info["DataType"])
+    datatype_info = _get_datatype_info(datatype)
 
     # 计算内存占用
-    bpp = _get_bytes_per_pixel(tiff_info["DataType"])
-    uncompressed_size = total_pixels * tiff_info["RasterCount"] * bpp
+    uncompressed_size = total_pixels * tiff_info["RasterCount"] * _get_bytes_per_pixel(datatype)
 
     compression_ratio = 0.0
     if file_info and uncompressed_size > 0:
@@ -877,9 +1585,7 @@ def analyze_tiff_comprehensive(file_path: str) -> Dict[str, Any]:
         "analysis": {
             "total_pixels": total_pixels,
             "aspect_ratio": aspect_ratio,
-            "aspect_type": "横版"
-            if aspect_ratio > 1
-            else ("竖版" if aspect_ratio < 1 else "正方形"),
+            "aspect_type": _ASPECT_TYPES[(aspect_ratio > 1) - (aspect_ratio < 1) + 1],
             "datatype_info": datatype_info,
             "uncompressed_size": uncompressed_size,
             "compression_ratio": compression_ratio,
@@ -887,16 +1593,85 @@ def analyze_tiff_comprehensive(file_path: str) -> Dict[str, Any]:
     }
 
 
+def _process_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """创建批处理进程池
+
+    支持时使用forkserver并预加载本模块，GDAL驱动注册只在服务进程中执行一次，
+    之后派生的工作进程直接复用。
+
+    Args:
+        workers: 并行进程数，None表示CPU核数
+
+    Returns:
+        ProcessPoolExecutor: 未启动的进程池
+    """
+    import multiprocessing
+
+    context = None
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+
+def analyze_tiff_batch(
+    paths: List[str], workers: Optional[int] = None, compute_stats: bool = True
+) -> List[Dict[str, Any]]:
+    """用进程池并行分析多个TIFF文件
+
+    GDAL数据集不能跨线程共享，按文件分发到多个进程执行；每个工作进程导入本模块时
+    即应用默认的GDAL配置，并在处理多个文件时复用各自的坐标系/投影单位缓存。
+
+    Args:
+        paths: TIFF文件路径列表
+        workers: 并行进程数，None表示CPU核数，1表示在当前进程中顺序执行
+        compute_stats: 是否计算波段统计信息（见 tiffinfo）
+
+    Returns:
+        list: 与 paths 顺序一一对应的分析结果
+    """
+    paths = list(paths)
+    if len(paths) <= 1 or workers == 1:
+        return [analyze_tiff_comprehensive(path, compute_stats) for path in paths]
+
+    max_workers = workers or os.cpu_count() or 1
+    # 每个进程分批领取任务以减少进程间通信，同时保留若干批次用于负载均衡
+    chunksize = max(1, len(paths) // (max_workers * 4))
+    with _process_pool(max_workers) as executor:
+        return list(
+            executor.map(
+                analyze_tiff_comprehensive,
+                paths,
+                [compute_stats] * len(paths),
+                chunksize=chunksize,
+            )
+        )
+
+
 # ===========================
 # 显示工具模块
 # ===========================
 
 
+def _raster_size(file_path: str) -> Tuple[int, int]:
+    """只打开数据集读取栅格尺寸
+
+    Returns:
+        tuple: (宽度, 高度)
+
+    Raises:
+        RuntimeError: 如果无法打开文件
+    """
+    dataset = _safe_open_dataset(file_path)
+    return dataset.RasterXSize, dataset.RasterYSize
+
+
 def process_tiff_conversion(
     input_path: str,
     output_path: str,
     truncated_value: float = 1,
-    downsample: int = 1
+    downsample: int = 1,
+    compress_level: Optional[int] = None,
 ) -> Dict[str, Any]:
     """处理TIFF转换为PNG的完整流程
 
@@ -905,46 +1680,44 @@ def process_tiff_conversion(
         output_path: 输出PNG文件路径
         truncated_value: 量化截断百分比
         downsample: 降采样倍数
+        compress_level: PNG压缩级别（0-9），None表示使用OpenCV默认的快速预设
 
     Returns:
         dict: 包含处理结果的详细信息
     """
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
-    # 获取输入文件信息
-    input_analysis = analyze_tiff_comprehensive(input_path)
+    # 输入文件分析与转换互不依赖：分析在后台线程中进行，与转换重叠执行
+    # （转换/裁切结果的显示不包含波段统计和元数据，无需扫描像素）
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        analysis_future = executor.submit(
+            analyze_tiff_comprehensive, input_path, compute_stats=False, with_metadata=False
+        )
 
-    # 执行转换
-    result_path = tiff2png(input_path, output_path, truncated_value, downsample)
+        # 执行转换
+        result_path = tiff2png(input_path, output_path, truncated_value, downsample, compress_level)
+        input_analysis = analysis_future.result()
 
-    end_time = datetime.datetime.now()
-    processing_time = (end_time - start_time).total_seconds()
+    # 单调时钟计时，不受系统时间调整影响
+    processing_time = time.perf_counter() - start_time
 
-    # 分析输出文件
-    output_info = _get_file_info(result_path) if os.path.exists(result_path) else None
+    # 分析输出文件（文件不存在时 _get_file_info 返回None，无需再单独检查）
+    output_info = _get_file_info(result_path)
 
     png_info = None
-    if os.path.exists(result_path):
+    if output_info is not None:
         try:
-            from PIL import Image
-            with Image.open(result_path) as img:
-                png_info = {
-                    "size": img.size,
-                    "mode": img.mode,
-                    "format": img.format,
-                    "info": getattr(img, "info", {}),
-                }
+            png_info = _read_png_header(result_path)
         except Exception as e:
             png_info = {"error": str(e)}
 
-    # 计算压缩率
+    # 计算压缩率（文件信息要么为None，要么是 _file_info_from_stat 构建的字典，无需再检查类型）
     compression_ratio = 0.0
-    if (input_analysis and input_analysis["file_info"] and output_info and
-        isinstance(input_analysis["file_info"]["size_bytes"], (int, float)) and
-        isinstance(output_info["size_bytes"], (int, float))):
+    input_file_info = input_analysis["file_info"]
+    if input_file_info is not None and output_info is not None:
         compression_ratio = _calculate_file_compression_ratio(
             output_info["size_bytes"],
-            input_analysis["file_info"]["size_bytes"]
+            input_file_info["size_bytes"]
         )
 
     return {
@@ -957,6 +1730,7 @@ def process_tiff_conversion(
         "parameters": {
             "truncated_value": truncated_value,
             "downsample": downsample,
+            "compress_level": compress_level,
         },
     }
 
@@ -982,63 +1756,58 @@ def process_tiff_cropping(
     Returns:
         dict: 包含裁切结果的详细信息
     """
-    start_time = datetime.datetime.now()
+    start_time = time.perf_counter()
 
-    # 获取输入文件信息
-    input_analysis = analyze_tiff_comprehensive(input_path)
+    # 验证裁切范围（只需打开数据集读取尺寸，不必等待完整分析）
+    raster_x_size, raster_y_size = _raster_size(input_path)
+    errors: List[str] = []
 
-    # 验证裁切范围
-    crop_validation: Dict[str, Union[bool, List[str]]] = {"valid": True, "errors": [], "warnings": []}
+    if xoff + xsize > raster_x_size:
+        errors.append("X轴裁切范围超出图像边界")
 
-    if input_analysis and input_analysis.get("tiff_info") and input_analysis["tiff_info"]:
-        tiff_info = input_analysis["tiff_info"]
-        raster_x_size = tiff_info.get("RasterXSize") if isinstance(tiff_info, dict) else None
-        raster_y_size = tiff_info.get("RasterYSize") if isinstance(tiff_info, dict) else None
-
-        if isinstance(raster_x_size, int) and xoff + xsize > raster_x_size:
-            crop_validation["valid"] = False
-            errors = crop_validation["errors"]
-            if isinstance(errors, list):
-                errors.append("X轴裁切范围超出图像边界")
-
-        if isinstance(raster_y_size, int) and yoff + ysize > raster_y_size:
-            crop_validation["valid"] = False
-            errors = crop_validation["errors"]
-            if isinstance(errors, list):
-                errors.append("Y轴裁切范围超出图像边界")
-
-    # 计算裁切比例
+    if yoff + ysize > raster_y_size:
+        errors.append("Y轴裁切范围超出图像边界")
+
+    crop_validation: Dict[str, Any] = {
+        "valid": not errors,
+        "errors": errors,
+        "warnings": [],
+    }
+
+    # 输入文件分析与裁切互不依赖：分析在后台线程中进行，与裁切重叠执行
+    # （转换/裁切结果的显示不包含波段统计和元数据，无需扫描像素）
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        analysis_future = executor.submit(
+            analyze_tiff_comprehensive, input_path, compute_stats=False, with_metadata=False
+        )
+
+        # 执行裁切
+        result_path = None
+        if not errors:
+            result_path = cutiff(input_path, output_path, xoff, yoff, xsize, ysize)
+        input_analysis = analysis_future.result()
+
+    # 计算裁切比例（analyze_tiff_comprehensive 总会给出整数 total_pixels）
     crop_pixels = xsize * ysize
     crop_ratio = 0.0
-    if input_analysis and input_analysis.get("analysis") and input_analysis["analysis"]:
-        analysis_data = input_analysis["analysis"]
-        original_pixels = analysis_data.get("total_pixels") if isinstance(analysis_data, dict) else None
-        if isinstance(original_pixels, (int, float)) and original_pixels > 0:
-            crop_ratio = (crop_pixels / original_pixels) * 100
+    original_pixels = input_analysis["analysis"]["total_pixels"]
+    if original_pixels > 0:
+        crop_ratio = (crop_pixels / original_pixels) * 100
 
-    # 执行裁切
-    result_path = None
-    if crop_validation["valid"]:
-        result_path = cutiff(input_path, output_path, xoff, yoff, xsize, ysize)
+    # 单调时钟计时，不受系统时间调整影响
+    processing_time = time.perf_counter() - start_time
 
-    end_time = datetime.datetime.now()
-    processing_time = (end_time - start_time).total_seconds()
-
-    # 分析输出文件
+    # 分析输出文件（cutiff 成功返回即已写出文件，分析时只 stat 一次，文件信息取自分析结果）
     output_analysis = None
-    if result_path and os.path.exists(result_path):
-        output_analysis = analyze_tiff_comprehensive(result_path)
+    if result_path:
+        output_analysis = analyze_tiff_comprehensive(result_path, compute_stats=False, with_metadata=False)
 
     # 计算处理效率
     pixels_per_second = crop_pixels / processing_time if processing_time > 0 else 0
     mb_per_second = 0.0
-    if (output_analysis and output_analysis.get("file_info") and output_analysis["file_info"] and
-        isinstance(output_analysis["file_info"], dict) and
-        isinstance(output_analysis["file_info"].get("size_mb"), (int, float)) and
-        processing_time > 0):
-        size_mb = output_analysis["file_info"]["size_mb"]
-        if isinstance(size_mb, (int, float)):
-            mb_per_second = size_mb / processing_time
+    output_file_info = output_analysis["file_info"] if output_analysis is not None else None
+    if output_file_info is not None and processing_time > 0:
+        mb_per_second = output_file_info["size_mb"] / processing_time
 
     return {
         "input_analysis": input_analysis,
@@ -1061,532 +1830,568 @@ def process_tiff_cropping(
     }
 
 
-def create_display_functions():
-    """创建显示函数模块"""
-    from rich.console import Console
+@functools.lru_cache(maxsize=None)
+def _get_console():
+    """获取共享的rich控制台
 
+    输出不支持颜色（如重定向到文件或管道）时，高亮产生的样式不会被写出，
+    此时换用空高亮器，省去对每段文本的正则扫描，输出的纯文本不变。
+    """
     console = Console()
+    if console.color_system is None:
+        console.highlighter = NullHighlighter()
+    return console
 
-    def display_tiff_basic_info(info):
-        """显示TIFF文件基本信息"""
-        console.print(
-            "\n================ TIFF 信息 =================",
-            style="bright_yellow bold",
-        )
-        emoji_map = {
-            "RasterXSize": "🟦",
-            "RasterYSize": "🟩",
-            "RasterCount": "📊",
-            "DataType": "🔢",
-            "GeoTransform": "🧭",
-            "Projection": "🌐",
-            "GeographicBounds": "🗺️",
-            "GeographicCenter": "📍",
-        }
-
-        for k, v in info.items():
-            emoji = emoji_map.get(k, "➡️")
-            if k in ["RasterXSize", "RasterYSize"]:
-                color = "bright_cyan"
-            elif k == "RasterCount":
-                color = "bright_magenta"
-            elif k == "DataType":
-                color = "bright_green"
-            elif k == "GeoTransform":
-                color = "bright_blue"
-            elif k == "Projection":
-                color = "bright_yellow"
-            elif k in ["GeographicBounds", "GeographicCenter"]:
-                color = "bright_magenta"
-            else:
-                color = "white"
-
-            console.print(f"{emoji} {k:14}: ", style=f"{color} bold", end="")
-
-            if k == "Projection":
-                _display_projection_info(console, str(v))
-            elif k == "DataType":
-                _display_datatype_info(console, int(v))
-            elif k == "GeoTransform":
-                _display_geotransform_info(console, eval(str(v)))
-            elif k == "GeographicBounds":
-                _display_bounds_info(console, v)
-            elif k == "GeographicCenter":
-                _display_center_info(console, v)
-            else:
-                console.print(f"{v}", style="white")
 
-        console.print(
-            "============================================\n",
-            style="bright_yellow bold",
-        )
+def _buffered_display(func):
+    """显示函数装饰器：函数内的所有输出先进入控制台缓冲区，结束时一次性写出"""
 
-    def _display_projection_info(console, proj):
-        """显示投影信息"""
-        keywords = [
-            "PROJCS",
-            "GEOGCS",
-            "DATUM",
-            "SPHEROID",
-            "PRIMEM",
-            "PROJECTION",
-            "PARAMETER",
-            "UNIT",
-            "AXIS",
-            "AUTHORITY",
-        ]
-        i = 0
-        while i < len(proj):
-            next_keyword = None
-            next_pos = len(proj)
-
-            for keyword in keywords:
-                pos = proj.find(keyword, i)
-                if pos != -1 and pos < next_pos:
-                    next_pos = pos
-                    next_keyword = keyword
-
-            bracket_pos = min(
-                [pos for pos in [proj.find("[", i), proj.find("]", i)] if pos != -1]
-                + [len(proj)]
-            )
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _get_console():
+            return func(*args, **kwargs)
 
-            if bracket_pos < next_pos:
-                if bracket_pos > i:
-                    console.print(proj[i:bracket_pos], end="")
-                console.print(proj[bracket_pos], style="bright_cyan", end="")
-                i = bracket_pos + 1
-            elif next_keyword:
-                if next_pos > i:
-                    console.print(proj[i:next_pos], end="")
-                console.print(next_keyword, style="bright_yellow bold", end="")
-                i = next_pos + len(next_keyword)
-            else:
-                console.print(proj[i:], end="")
-                break
-        console.print("")
-
-    def _display_datatype_info(console, datatype):
-        """显示数据类型信息"""
-        datatype_map = {
-            0: "Unknown (未知)",
-            1: "Byte (8-bit unsigned integer, 无符号8位整数)",
-            2: "UInt16 (16-bit unsigned integer, 无符号16位整数)",
-            3: "Int16 (16-bit signed integer, 有符号16位整数)",
-            4: "UInt32 (32-bit unsigned integer, 无符号32位整数)",
-            5: "Int32 (32-bit signed integer, 有符号32位整数)",
-            6: "Float32 (32-bit floating point, 32位浮点数)",
-            7: "Float64 (64-bit floating point, 64位浮点数)",
-            8: "CInt16 (Complex Int16, 复数16位整数)",
-            9: "CInt32 (Complex Int32, 复数32位整数)",
-            10: "CFloat32 (Complex Float32, 复数32位浮点数)",
-            11: "CFloat64 (Complex Float64, 复数64位浮点数)",
-        }
-        datatype_desc = datatype_map.get(datatype, f"Unknown type {datatype}")
-        console.print(f"{datatype} ({datatype_desc})", style="white")
-
-    def _display_geotransform_info(console, geo_params):
-        """显示地理变换信息"""
-        param_names = [
-            "X原点坐标 (左上角X坐标)",
-            "像素宽度 (X方向分辨率)",
-            "X倾斜 (通常为0)",
-            "Y原点坐标 (左上角Y坐标)",
-            "Y倾斜 (通常为0)",
-            "像素高度 (Y方向分辨率，通常为负值)",
-        ]
-        console.print()
-        param_colors = [
-            "bright_cyan",
-            "bright_green",
-            "bright_black",
-            "bright_magenta",
-            "bright_black",
-            "bright_yellow",
-        ]
-        for i, (param, desc, color) in enumerate(
-            zip(geo_params, param_names, param_colors)
-        ):
-            console.print(f"      [{i}] ", style="white", end="")
-            console.print(f"{param:15.3f}", style=f"{color} bold", end="")
-            console.print(f" - {desc}", style="bright_white")
-
-    def _display_bounds_info(console, bounds):
-        """显示边界信息"""
-        if bounds:
-            console.print()
-            console.print(f"      西边界: {bounds['west']:10.6f}°", style="bright_cyan")
-            console.print(f"      东边界: {bounds['east']:10.6f}°", style="bright_cyan")
-            console.print(
-                f"      南边界: {bounds['south']:10.6f}°", style="bright_green"
-            )
-            console.print(
-                f"      北边界: {bounds['north']:10.6f}°", style="bright_green"
-            )
-        else:
-            console.print("无法获取地理边界信息", style="bright_black")
+    return wrapper
 
-    def _display_center_info(console, center):
-        """显示中心点信息"""
-        if center:
-            console.print()
-            console.print(
-                f"      经度: {center['longitude']:10.6f}°", style="bright_yellow"
-            )
-            console.print(
-                f"      纬度: {center['latitude']:10.6f}°", style="bright_yellow"
-            )
+
+@_buffered_display
+def display_tiff_basic_info(info):
+    """显示TIFF文件基本信息"""
+    console = _get_console()
+    console.print(
+        "\n================ TIFF 信息 =================",
+        style="bright_yellow bold",
+    )
+
+    # 循环内用到的方法提前绑定为局部变量
+    print_ = console.print
+    get_dispatch = _BASIC_INFO_DISPATCH.get
+    default_dispatch = _BASIC_INFO_DEFAULT_DISPATCH
+
+    for k, v in info.items():
+        emoji, label_style, renderer = get_dispatch(k, default_dispatch)
+        label = f"{emoji} {k:14}: "
+        if renderer is None:
+            # 标签与值拼成一个Text，整行只渲染一次；软换行避免长值（如BandInfo）被硬折行
+            line = Text()
+            line.append_text(_styled_segment(console, label, label_style))
+            line.append_text(_styled_segment(console, f"{v}", "white"))
+            print_(line, soft_wrap=True)
         else:
-            console.print("无法获取地理中心信息", style="bright_black")
+            print_(label, style=label_style, end="")
+            renderer(console, v)
 
-    def display_conversion_results(results):
-        """显示转换结果"""
-        input_analysis = results["input_analysis"]
+    console.print(
+        "============================================\n",
+        style="bright_yellow bold",
+    )
 
-        # 显示处理开始信息
-        console.print(
-            "\n🎯 =============== TIFF转PNG处理开始 ===============",
-            style="bright_yellow bold",
-        )
 
-        # 显示输入文件信息
-        if input_analysis["file_info"]:
-            file_info = input_analysis["file_info"]
-            tiff_info = input_analysis["tiff_info"]
+def _styled_segment(console, content: str, style: str = "") -> Text:
+    """构造与 console.print(content, style=style) 高亮效果一致的Text片段"""
+    segment = Text(content, style=style)
+    console.highlighter.highlight(segment)
+    return segment
 
-            console.print(
-                f"📂 输入文件路径: {tiff_info.get('FilePath', 'N/A')}",
-                style="bright_cyan",
-            )
-            console.print(
-                f"📏 输入文件大小: {file_info['size_bytes']:,} 字节 ({file_info['size_mb']:.2f} MB)",
-                style="bright_green",
-            )
-            console.print(
-                f"📅 文件创建时间: {file_info['created_time']}", style="bright_blue"
-            )
-            console.print(
-                f"🔄 文件修改时间: {file_info['modified_time']}", style="bright_magenta"
-            )
 
-        # 显示TIFF详细信息
-        console.print("\n📊 正在分析输入TIFF文件...", style="bright_white bold")
-        _display_detailed_tiff_info(console, input_analysis)
+# WKT关键字与方括号，split后奇数下标为匹配到的分隔符
+_WKT_TOKEN_RE = re.compile(
+    r"(PROJCS|GEOGCS|DATUM|SPHEROID|PRIMEM|PROJECTION|PARAMETER|UNIT|AXIS|AUTHORITY|\[|\])"
+)
 
-        # 显示处理结果
+
+def _display_projection_info(console, proj):
+    """显示投影信息
+
+    单次正则扫描拆分WKT，拼成一个带样式的Text后一次性输出。
+    """
+    # tiffinfo 给出的已经是原生类型，只在类型不符时才转换
+    if not isinstance(proj, str):
+        proj = str(proj)
+    # 循环内用到的属性和样式提前绑定为局部变量
+    highlight = console.highlighter.highlight
+    text = Text()
+    append = text.append_text
+    new_text = Text
+    bracket_style, keyword_style = "bright_cyan", "bright_yellow bold"
+    for index, part in enumerate(_WKT_TOKEN_RE.split(proj)):
+        if not part:
+            continue
+        if index % 2 == 0:
+            style = ""
+        elif part in "[]":
+            style = bracket_style
+        else:
+            style = keyword_style
+        segment = new_text(part, style=style)
+        highlight(segment)
+        append(segment)
+    # 软换行：WKT保持为一整行逻辑文本，不按控制台宽度硬折行（与逐段输出时一致）
+    console.print(text, soft_wrap=True)
+
+
+def _display_datatype_info(console, datatype):
+    """显示数据类型信息"""
+    if not isinstance(datatype, int):
+        datatype = int(datatype)
+    datatype_desc = _GDAL_DTYPE_MAP.get(datatype, f"Unknown type {datatype}")
+    console.print(f"{datatype} ({datatype_desc})", style="white")
+
+
+# 地理变换六个参数的说明及显示样式
+_GEOTRANSFORM_PARAM_NAMES = (
+    "X原点坐标 (左上角X坐标)",
+    "像素宽度 (X方向分辨率)",
+    "X倾斜 (通常为0)",
+    "Y原点坐标 (左上角Y坐标)",
+    "Y倾斜 (通常为0)",
+    "像素高度 (Y方向分辨率，通常为负值)",
+)
+_GEOTRANSFORM_PARAM_STYLES = (
+    "bright_cyan bold",
+    "bright_green bold",
+    "bright_black bold",
+    "bright_magenta bold",
+    "bright_black bold",
+    "bright_yellow bold",
+)
+
+
+def _display_geotransform_info(console, geo_params):
+    """显示地理变换信息"""
+    if not isinstance(geo_params, (tuple, list)):
+        geo_params = tuple(geo_params)
+    # 六个参数拼成一个Text后一次输出
+    text = Text("\n")
+    for i, (param, desc, style) in enumerate(
+        zip(geo_params, _GEOTRANSFORM_PARAM_NAMES, _GEOTRANSFORM_PARAM_STYLES)
+    ):
+        text.append_text(_styled_segment(console, f"      [{i}] ", "white"))
+        text.append_text(_styled_segment(console, f"{param:15.3f}", style))
+        text.append_text(_styled_segment(console, f" - {desc}\n", "bright_white"))
+    console.print(text, end="")
+
+
+def _display_bounds_info(console, bounds):
+    """显示边界信息"""
+    if bounds:
+        console.print()
+        console.print(f"      西边界: {bounds['west']:10.6f}°", style="bright_cyan")
+        console.print(f"      东边界: {bounds['east']:10.6f}°", style="bright_cyan")
         console.print(
-            f"\n✅ PNG转换完成! 耗时: {results['processing_time']:.3f} 秒",
-            style="bright_green bold",
+            f"      南边界: {bounds['south']:10.6f}°", style="bright_green"
         )
-        console.print(f"💾 输出文件: {results['output_path']}", style="bright_cyan")
-
-        # 显示输出文件信息
-        if results["output_info"]:
-            output_info = results["output_info"]
-            console.print(
-                f"📏 输出文件大小: {output_info['size_bytes']:,} 字节 ({output_info['size_mb']:.2f} MB)",
-                style="bright_green",
-            )
-            console.print(
-                f"📦 压缩率: {results['compression_ratio']:.1f}%",
-                style="bright_magenta",
-            )
+        console.print(
+            f"      北边界: {bounds['north']:10.6f}°", style="bright_green"
+        )
+    else:
+        console.print("无法获取地理边界信息", style="bright_black")
 
-        # 显示PNG信息
-        if results["png_info"] and "error" not in results["png_info"]:
-            png_info = results["png_info"]
-            console.print("🖼️  输出PNG详细信息:", style="bright_yellow bold")
-            console.print(
-                f"   📐 尺寸: {png_info['size'][0]} × {png_info['size'][1]} 像素",
-                style="cyan",
-            )
-            console.print(f"   🎨 模式: {png_info['mode']}", style="green")
-            console.print(f"   📊 格式: {png_info['format']}", style="blue")
 
+def _display_center_info(console, center):
+    """显示中心点信息"""
+    if center:
+        console.print()
+        console.print(
+            f"      经度: {center['longitude']:10.6f}°", style="bright_yellow"
+        )
         console.print(
-            "🎯 =============== TIFF转PNG处理完成 ===============\n",
-            style="bright_yellow bold",
+            f"      纬度: {center['latitude']:10.6f}°", style="bright_yellow"
         )
+    else:
+        console.print("无法获取地理中心信息", style="bright_black")
+
+
+# 基本信息各字段的 (图标, 标签样式, 值的显示函数)，显示函数为None时直接输出值
+_BASIC_INFO_DISPATCH = {
+    "RasterXSize": ("🟦", "bright_cyan bold", None),
+    "RasterYSize": ("🟩", "bright_cyan bold", None),
+    "RasterCount": ("📊", "bright_magenta bold", None),
+    "DataType": ("🔢", "bright_green bold", _display_datatype_info),
+    "GeoTransform": ("🧭", "bright_blue bold", _display_geotransform_info),
+    "Projection": ("🌐", "bright_yellow bold", _display_projection_info),
+    "GeographicBounds": ("🗺️", "bright_magenta bold", _display_bounds_info),
+    "GeographicCenter": ("📍", "bright_magenta bold", _display_center_info),
+}
+# 未列出的字段使用箭头和白色标签
+_BASIC_INFO_DEFAULT_DISPATCH = ("➡️", "white bold", None)
+
+
+@_buffered_display
+def display_conversion_results(results):
+    """显示转换结果"""
+    console = _get_console()
+    input_analysis = results["input_analysis"]
+
+    # 显示处理开始信息
+    console.print(
+        "\n🎯 =============== TIFF转PNG处理开始 ===============",
+        style="bright_yellow bold",
+    )
 
-    def _display_detailed_tiff_info(console, analysis):
-        """显示详细的TIFF信息"""
-        tiff_info = analysis["tiff_info"]
-        distance_area = analysis["distance_area"]
-        coordinates = analysis["coordinates"]
-        analysis_data = analysis["analysis"]
+    # 显示输入文件信息
+    if input_analysis["file_info"]:
+        file_info = input_analysis["file_info"]
+        tiff_info = input_analysis["tiff_info"]
 
-        console.print("🖼️  输入TIFF详细信息:", style="bright_yellow bold")
         console.print(
-            f"   🟦 图像尺寸: {tiff_info['RasterXSize']} × {tiff_info['RasterYSize']} 像素",
+            f"📂 输入文件路径: {tiff_info.get('FilePath', 'N/A')}",
             style="bright_cyan",
         )
         console.print(
-            f"   📐 总像素数: {analysis_data['total_pixels']:,} 个像素",
+            f"📏 输入文件大小: {file_info['size_bytes']:,} 字节 ({file_info['size_mb']:.2f} MB)",
             style="bright_green",
         )
         console.print(
-            f"   📊 波段数量: {tiff_info['RasterCount']} 个波段", style="bright_magenta"
+            f"📅 文件创建时间: {file_info['created_time']}", style="bright_blue"
         )
         console.print(
-            f"   🔢 数据类型: {analysis_data['datatype_info'][1]}", style="bright_red"
+            f"🔄 文件修改时间: {file_info['modified_time']}", style="bright_magenta"
         )
 
-        # 地理信息
-        geo = tiff_info.get("GeoTransform")
-        if geo and geo != (0.0, 1.0, 0.0, 0.0, 0.0, 1.0):
-            console.print("   🗺️  地理坐标信息:", style="bright_blue")
-            console.print(
-                f"      📍 左上角坐标: ({geo[0]:.6f}, {geo[3]:.6f})", style="cyan"
-            )
-            console.print(
-                f"      📏 像素分辨率: {geo[1]:.6f} × {abs(geo[5]):.6f}", style="green"
-            )
+    # 显示TIFF详细信息
+    console.print("\n📊 正在分析输入TIFF文件...", style="bright_white bold")
+    _display_detailed_tiff_info(console, input_analysis)
+
+    # 显示处理结果
+    console.print(
+        f"\n✅ PNG转换完成! 耗时: {results['processing_time']:.3f} 秒",
+        style="bright_green bold",
+    )
+    console.print(f"💾 输出文件: {results['output_path']}", style="bright_cyan")
 
-            if distance_area["x_span_km"] is not None:
-                console.print(
-                    f"      🗺️  覆盖范围: {distance_area['x_span_km']:.3f}千米 × {distance_area['y_span_km']:.3f}千米",
-                    style="yellow",
-                )
-
-            if coordinates["bounds_str"]:
-                console.print(
-                    f"      🌐 经纬度边界: {coordinates['bounds_str']}",
-                    style="bright_cyan",
-                )
-            if coordinates["center_str"]:
-                console.print(
-                    f"      📍 中心位置: {coordinates['center_str']}",
-                    style="bright_green",
-                )
-
-    def display_cropping_results(results):
-        """显示裁切结果"""
-        input_analysis = results["input_analysis"]
-        crop_info = results["crop_info"]
-
-        # 显示处理开始信息
+    # 显示输出文件信息
+    if results["output_info"]:
+        output_info = results["output_info"]
+        console.print(
+            f"📏 输出文件大小: {output_info['size_bytes']:,} 字节 ({output_info['size_mb']:.2f} MB)",
+            style="bright_green",
+        )
         console.print(
-            "\n✂️ =============== TIFF裁切处理开始 ===============",
-            style="bright_yellow bold",
+            f"📦 压缩率: {results['compression_ratio']:.1f}%",
+            style="bright_magenta",
         )
 
-        # 显示裁切参数
-        console.print("📐 裁切参数信息:", style="bright_cyan bold")
-        console.print(f"   📍 起始位置 (X偏移): {crop_info['xoff']} 像素", style="blue")
-        console.print(f"   📍 起始位置 (Y偏移): {crop_info['yoff']} 像素", style="blue")
-        console.print(f"   📏 裁切宽度: {crop_info['xsize']} 像素", style="magenta")
-        console.print(f"   📏 裁切高度: {crop_info['ysize']} 像素", style="magenta")
+    # 显示PNG信息
+    if results["png_info"] and "error" not in results["png_info"]:
+        png_info = results["png_info"]
+        console.print("🖼️  输出PNG详细信息:", style="bright_yellow bold")
         console.print(
-            f"   📊 裁切像素总数: {crop_info['crop_pixels']:,} 个像素", style="yellow"
+            f"   📐 尺寸: {png_info['size'][0]} × {png_info['size'][1]} 像素",
+            style="cyan",
         )
-        console.print(f"   📊 裁切比例: {crop_info['crop_ratio']:.2f}%", style="yellow")
+        console.print(f"   🎨 模式: {png_info['mode']}", style="green")
+        console.print(f"   📊 格式: {png_info['format']}", style="blue")
 
-        # 显示验证结果
-        validation = results["crop_validation"]
-        if validation["valid"]:
-            console.print("✅ 裁切范围验证通过", style="bright_green")
-        else:
-            console.print("⚠️  警告: 裁切范围验证失败!", style="bright_red bold")
-            for error in validation["errors"]:
-                console.print(f"   ❌ {error}", style="red")
+    console.print(
+        "🎯 =============== TIFF转PNG处理完成 ===============\n",
+        style="bright_yellow bold",
+    )
 
-        # 显示处理结果
-        if results["output_path"]:
-            console.print(
-                f"\n✅ TIFF裁切完成! 耗时: {results['processing_time']:.3f} 秒",
-                style="bright_green bold",
-            )
-            console.print(f"💾 输出文件: {results['output_path']}", style="bright_cyan")
-
-            # 显示输出分析
-            if results["output_analysis"]:
-                output_analysis = results["output_analysis"]
-                console.print("\n🎯 输出TIFF详细分析:", style="bright_yellow bold")
-                console.print(
-                    f"   📏 输出文件大小: {output_analysis['file_info']['size_bytes']:,} 字节 ({output_analysis['file_info']['size_mb']:.2f} MB)",
-                    style="green",
-                )
-                console.print(
-                    f"   🟦 输出图像尺寸: {output_analysis['tiff_info']['RasterXSize']} × {output_analysis['tiff_info']['RasterYSize']} 像素",
-                    style="cyan",
-                )
-
-                # 处理效率
-                performance = results["performance"]
-                console.print(
-                    f"   ⚡ 处理效率: {performance['pixels_per_second']:,.0f} 像素/秒, {performance['mb_per_second']:.2f} MB/秒",
-                    style="bright_green",
-                )
 
-        console.print(
-            "✂️ =============== TIFF裁切处理完成 ===============\n",
-            style="bright_yellow bold",
-        )
+def _display_detailed_tiff_info(console, analysis):
+    """显示详细的TIFF信息"""
+    tiff_info = analysis["tiff_info"]
+    distance_area = analysis["distance_area"]
+    coordinates = analysis["coordinates"]
+    analysis_data = analysis["analysis"]
 
-    def display_comprehensive_info(analysis):
-        """显示综合信息"""
-        file_info = analysis["file_info"]
-        tiff_info = analysis["tiff_info"]
-        analysis_data = analysis["analysis"]
-        distance_area = analysis["distance_area"]
-        coordinates = analysis["coordinates"]
+    console.print("🖼️  输入TIFF详细信息:", style="bright_yellow bold")
+    console.print(
+        f"   🟦 图像尺寸: {tiff_info['RasterXSize']} × {tiff_info['RasterYSize']} 像素",
+        style="bright_cyan",
+    )
+    console.print(
+        f"   📐 总像素数: {analysis_data['total_pixels']:,} 个像素",
+        style="bright_green",
+    )
+    console.print(
+        f"   📊 波段数量: {tiff_info['RasterCount']} 个波段", style="bright_magenta"
+    )
+    console.print(
+        f"   🔢 数据类型: {analysis_data['datatype_info'][1]}", style="bright_red"
+    )
 
-        # 标题
+    # 地理信息
+    geo = tiff_info.get("GeoTransform")
+    if geo and geo != _IDENTITY_GEOTRANSFORM:
+        console.print("   🗺️  地理坐标信息:", style="bright_blue")
         console.print(
-            "\n📊 ============== TIFF图像详细分析报告 ==============",
-            style="bright_yellow bold",
+            f"      📍 左上角坐标: ({geo[0]:.6f}, {geo[3]:.6f})", style="cyan"
+        )
+        console.print(
+            f"      📏 像素分辨率: {geo[1]:.6f} × {abs(geo[5]):.6f}", style="green"
         )
 
-        # 文件基本信息
-        if file_info:
-            console.print("\n📁 文件系统信息:", style="bright_cyan bold")
-            console.print(f"   📂 文件路径: {tiff_info.get('FilePath', 'N/A')}", style="cyan")
-            console.print(f"   📝 文件名: {tiff_info.get('FileName', 'N/A')}", style="green")
+        if distance_area["x_span_km"] is not None:
             console.print(
-                f"   📏 文件大小: {file_info['size_bytes']:,} 字节 ({file_info['size_mb']:.2f} MB)",
-                style="blue",
+                f"      🗺️  覆盖范围: {distance_area['x_span_km']:.3f}千米 × {distance_area['y_span_km']:.3f}千米",
+                style="yellow",
             )
+
+        if coordinates["bounds_str"]:
             console.print(
-                f"   📅 创建时间: {file_info['created_time']}", style="magenta"
+                f"      🌐 经纬度边界: {coordinates['bounds_str']}",
+                style="bright_cyan",
             )
+        if coordinates["center_str"]:
             console.print(
-                f"   🔄 修改时间: {file_info['modified_time']}", style="yellow"
+                f"      📍 中心位置: {coordinates['center_str']}",
+                style="bright_green",
             )
+
+
+@_buffered_display
+def display_cropping_results(results):
+    """显示裁切结果"""
+    console = _get_console()
+    input_analysis = results["input_analysis"]
+    crop_info = results["crop_info"]
+
+    # 显示处理开始信息
+    console.print(
+        "\n✂️ =============== TIFF裁切处理开始 ===============",
+        style="bright_yellow bold",
+    )
+
+    # 显示裁切参数
+    console.print("📐 裁切参数信息:", style="bright_cyan bold")
+    console.print(f"   📍 起始位置 (X偏移): {crop_info['xoff']} 像素", style="blue")
+    console.print(f"   📍 起始位置 (Y偏移): {crop_info['yoff']} 像素", style="blue")
+    console.print(f"   📏 裁切宽度: {crop_info['xsize']} 像素", style="magenta")
+    console.print(f"   📏 裁切高度: {crop_info['ysize']} 像素", style="magenta")
+    console.print(
+        f"   📊 裁切像素总数: {crop_info['crop_pixels']:,} 个像素", style="yellow"
+    )
+    console.print(f"   📊 裁切比例: {crop_info['crop_ratio']:.2f}%", style="yellow")
+
+    # 显示验证结果
+    validation = results["crop_validation"]
+    if validation["valid"]:
+        console.print("✅ 裁切范围验证通过", style="bright_green")
+    else:
+        console.print("⚠️  警告: 裁切范围验证失败!", style="bright_red bold")
+        for error in validation["errors"]:
+            console.print(f"   ❌ {error}", style="red")
+
+    # 显示处理结果
+    output_path = results["output_path"]
+    if output_path:
+        console.print(
+            f"\n✅ TIFF裁切完成! 耗时: {results['processing_time']:.3f} 秒",
+            style="bright_green bold",
+        )
+        console.print(f"💾 输出文件: {output_path}", style="bright_cyan")
+
+        # 显示输出分析
+        output_analysis = results["output_analysis"]
+        if output_analysis:
+            output_file_info = output_analysis["file_info"]
+            output_tiff_info = output_analysis["tiff_info"]
+            console.print("\n🎯 输出TIFF详细分析:", style="bright_yellow bold")
+            console.print(
+                f"   📏 输出文件大小: {output_file_info['size_bytes']:,} 字节 ({output_file_info['size_mb']:.2f} MB)",
+                style="green",
+            )
+            console.print(
+                f"   🟦 输出图像尺寸: {output_tiff_info['RasterXSize']} × {output_tiff_info['RasterYSize']} 像素",
+                style="cyan",
+            )
+
+            # 处理效率
+            performance = results["performance"]
             console.print(
-                f"   👁  访问时间: {file_info['accessed_time']}", style="bright_black"
+                f"   ⚡ 处理效率: {performance['pixels_per_second']:,.0f} 像素/秒, {performance['mb_per_second']:.2f} MB/秒",
+                style="bright_green",
             )
 
-        # 图像基本属性
-        console.print("\n🖼️  图像基本属性:", style="bright_green bold")
-        console.print(f"   🟦 图像宽度: {tiff_info['RasterXSize']} 像素", style="cyan")
-        console.print(f"   🟩 图像高度: {tiff_info['RasterYSize']} 像素", style="green")
+    console.print(
+        "✂️ =============== TIFF裁切处理完成 ===============\n",
+        style="bright_yellow bold",
+    )
+
+
+# 波段统计行的输出模板与样式，按波段信息字典格式化
+_BAND_STAT_LINES = (
+    ("      📉 最小值: {MinValue:.4f}", "blue"),
+    ("      📈 最大值: {MaxValue:.4f}", "red"),
+    ("      📊 平均值: {MeanValue:.4f}", "green"),
+    ("      📏 标准差: {StdDev:.4f}", "yellow"),
+)
+
+# GDAL颜色解释编号 -> 中文名称
+_COLOR_INTERP_NAMES = {
+    0: "未定义", 1: "灰度", 2: "调色板", 3: "红色", 4: "绿色", 5: "蓝色", 6: "Alpha"
+}
+
+
+def _display_band_details(console, band_info_list):
+    """显示各波段的统计分析，所有波段拼成一个Text后一次输出"""
+    text = Text()
+
+    def add(content, style):
+        text.append_text(_styled_segment(console, f"{content}\n", style))
+
+    for band_info in band_info_list:
+        add(f"\n   📊 波段 {band_info['BandNumber']}:", "bright_white bold")
+        min_value = band_info.get("MinValue")
+        if min_value is not None:
+            for template, style in _BAND_STAT_LINES:
+                add(template.format_map(band_info), style)
+
+            # 计算数值范围和变异系数
+            value_range = band_info['MaxValue'] - min_value
+            add(f"      🎯 数值范围: {value_range:.4f}", "magenta")
+
+            mean_value = band_info['MeanValue']
+            if mean_value != 0:
+                cv = (band_info['StdDev'] / abs(mean_value)) * 100
+                cv_desc = "低变异" if cv < 50 else ("中变异" if cv < 100 else "高变异")
+                add(f"      📊 变异系数: {cv:.2f}% ({cv_desc})", "bright_magenta")
+
+        nodata = band_info.get("NoDataValue")
+        if nodata is not None:
+            add(f"      🚫 无效值: {nodata}", "bright_black")
+
+        # 颜色解释
+        color_interp = _COLOR_INTERP_NAMES.get(band_info.get("ColorInterpretation", 0), "未知")
+        add(f"      🎨 颜色解释: {color_interp}", "bright_cyan")
+
+    console.print(text, end="")
+
+
+@_buffered_display
+def display_comprehensive_info(analysis):
+    """显示综合信息"""
+    console = _get_console()
+    file_info = analysis["file_info"]
+    tiff_info = analysis["tiff_info"]
+    analysis_data = analysis["analysis"]
+    distance_area = analysis["distance_area"]
+    coordinates = analysis["coordinates"]
+
+    # 标题
+    console.print(
+        "\n📊 ============== TIFF图像详细分析报告 ==============",
+        style="bright_yellow bold",
+    )
+
+    # 文件基本信息
+    if file_info:
+        console.print("\n📁 文件系统信息:", style="bright_cyan bold")
+        console.print(f"   📂 文件路径: {tiff_info.get('FilePath', 'N/A')}", style="cyan")
+        console.print(f"   📝 文件名: {tiff_info.get('FileName', 'N/A')}", style="green")
         console.print(
-            f"   📊 总像素数: {analysis_data['total_pixels']:,} 个像素", style="blue"
+            f"   📏 文件大小: {file_info['size_bytes']:,} 字节 ({file_info['size_mb']:.2f} MB)",
+            style="blue",
         )
         console.print(
-            f"   📊 波段数量: {tiff_info['RasterCount']} 个波段", style="magenta"
+            f"   📅 创建时间: {file_info['created_time']}", style="magenta"
         )
         console.print(
-            f"   📏 纵横比: {analysis_data['aspect_ratio']:.3f} ({analysis_data['aspect_type']})",
-            style="yellow",
+            f"   🔄 修改时间: {file_info['modified_time']}", style="yellow"
         )
         console.print(
-            f"   🔢 数据类型: {analysis_data['datatype_info'][0]} - {analysis_data['datatype_info'][1]}",
-            style="red",
+            f"   👁  访问时间: {file_info['accessed_time']}", style="bright_black"
         )
+
+    # 图像基本属性
+    console.print("\n🖼️  图像基本属性:", style="bright_green bold")
+    console.print(f"   🟦 图像宽度: {tiff_info['RasterXSize']} 像素", style="cyan")
+    console.print(f"   🟩 图像高度: {tiff_info['RasterYSize']} 像素", style="green")
+    console.print(
+        f"   📊 总像素数: {analysis_data['total_pixels']:,} 个像素", style="blue"
+    )
+    console.print(
+        f"   📊 波段数量: {tiff_info['RasterCount']} 个波段", style="magenta"
+    )
+    console.print(
+        f"   📏 纵横比: {analysis_data['aspect_ratio']:.3f} ({analysis_data['aspect_type']})",
+        style="yellow",
+    )
+    datatype_name, datatype_desc, value_range, bytes_desc = analysis_data["datatype_info"]
+    console.print(f"   🔢 数据类型: {datatype_name} - {datatype_desc}", style="red")
+    console.print(f"   📈 数值范围: {value_range}", style="bright_red")
+    console.print(f"   💾 内存占用: {bytes_desc}", style="bright_blue")
+
+    # 驱动信息
+    console.print("\n🔧 驱动信息:", style="bright_magenta bold")
+    console.print(f"   📦 驱动名称: {tiff_info.get('DriverShortName', 'N/A')}", style="magenta")
+    console.print(f"   📝 驱动描述: {tiff_info.get('DriverLongName', 'N/A')}", style="cyan")
+
+    # 地理信息
+    geotransform = tiff_info.get("GeoTransform")
+    if geotransform and geotransform != _IDENTITY_GEOTRANSFORM:
+        console.print("\n🗺️  地理坐标信息:", style="bright_blue bold")
         console.print(
-            f"   📈 数值范围: {analysis_data['datatype_info'][2]}", style="bright_red"
+            f"   📍 左上角坐标: ({geotransform[0]:.6f}, {geotransform[3]:.6f})", style="cyan"
         )
         console.print(
-            f"   💾 内存占用: {analysis_data['datatype_info'][3]}", style="bright_blue"
+            f"   📏 像素分辨率: {geotransform[1]:.6f} × {abs(geotransform[5]):.6f}", style="green"
         )
 
-        # 驱动信息
-        console.print("\n🔧 驱动信息:", style="bright_magenta bold")
-        console.print(f"   📦 驱动名称: {tiff_info.get('DriverShortName', 'N/A')}", style="magenta")
-        console.print(f"   📝 驱动描述: {tiff_info.get('DriverLongName', 'N/A')}", style="cyan")
-
-        # 地理信息
-        geotransform = tiff_info.get("GeoTransform")
-        if geotransform and geotransform != (0.0, 1.0, 0.0, 0.0, 0.0, 1.0):
-            console.print("\n🗺️  地理坐标信息:", style="bright_blue bold")
+        if distance_area.get("x_span_km") is not None:
             console.print(
-                f"   📍 左上角坐标: ({geotransform[0]:.6f}, {geotransform[3]:.6f})", style="cyan"
+                f"   🗺️  覆盖范围: {distance_area['x_span_km']:.3f}千米 × {distance_area['y_span_km']:.3f}千米",
+                style="yellow",
             )
             console.print(
-                f"   📏 像素分辨率: {geotransform[1]:.6f} × {abs(geotransform[5]):.6f}", style="green"
+                f"   📐 覆盖面积: {distance_area['area_km2']:.3f} 平方千米", style="bright_yellow"
             )
 
-            if distance_area.get("x_span_km") is not None:
-                console.print(
-                    f"   🗺️  覆盖范围: {distance_area['x_span_km']:.3f}千米 × {distance_area['y_span_km']:.3f}千米",
-                    style="yellow",
-                )
-                console.print(
-                    f"   📐 覆盖面积: {distance_area['area_km2']:.3f} 平方千米", style="bright_yellow"
-                )
-
-            if coordinates.get("bounds_str"):
-                console.print(
-                    f"   🌐 经纬度边界: {coordinates['bounds_str']}", style="bright_cyan"
-                )
-            if coordinates.get("center_str"):
-                console.print(
-                    f"   📍 中心位置: {coordinates['center_str']}", style="bright_green"
-                )
-
-            # 投影信息
-            projection = tiff_info.get("Projection")
-            if projection:
-                import re
-                console.print("\n🌐 投影坐标系信息:", style="bright_yellow bold")
-                # 提取关键投影信息
-                if "PROJCS" in projection:
-                    projcs_match = re.search(r'PROJCS\["([^"]+)"', projection)
-                    if projcs_match:
-                        console.print(f"   📊 投影名称: {projcs_match.group(1)}", style="yellow")
-
-                if "GEOGCS" in projection:
-                    geogcs_match = re.search(r'GEOGCS\["([^"]+)"', projection)
-                    if geogcs_match:
-                        console.print(f"   🌍 地理坐标系: {geogcs_match.group(1)}", style="green")
-
-                if "DATUM" in projection:
-                    datum_match = re.search(r'DATUM\["([^"]+)"', projection)
-                    if datum_match:
-                        console.print(f"   📐 大地基准: {datum_match.group(1)}", style="cyan")
-
-        # 波段详细分析
-        if tiff_info.get("BandInfo"):
-            console.print("\n📈 波段详细分析:", style="bright_red bold")
-            for band_info in tiff_info["BandInfo"]:
-                console.print(f"\n   📊 波段 {band_info['BandNumber']}:", style="bright_white bold")
-                if band_info.get("MinValue") is not None:
-                    console.print(f"      📉 最小值: {band_info['MinValue']:.4f}", style="blue")
-                    console.print(f"      📈 最大值: {band_info['MaxValue']:.4f}", style="red")
-                    console.print(f"      📊 平均值: {band_info['MeanValue']:.4f}", style="green")
-                    console.print(f"      📏 标准差: {band_info['StdDev']:.4f}", style="yellow")
-
-                    # 计算数值范围和变异系数
-                    value_range = band_info['MaxValue'] - band_info['MinValue']
-                    console.print(f"      🎯 数值范围: {value_range:.4f}", style="magenta")
-
-                    if band_info['MeanValue'] != 0:
-                        cv = (band_info['StdDev'] / abs(band_info['MeanValue'])) * 100
-                        cv_desc = "低变异" if cv < 50 else ("中变异" if cv < 100 else "高变异")
-                        console.print(f"      📊 变异系数: {cv:.2f}% ({cv_desc})", style="bright_magenta")
-
-                if band_info.get("NoDataValue") is not None:
-                    console.print(f"      🚫 无效值: {band_info['NoDataValue']}", style="bright_black")
-
-                # 颜色解释
-                color_interp_map = {
-                    0: "未定义", 1: "灰度", 2: "调色板", 3: "红色", 4: "绿色", 5: "蓝色", 6: "Alpha"
-                }
-                color_interp = color_interp_map.get(band_info.get("ColorInterpretation", 0), "未知")
-                console.print(f"      🎨 颜色解释: {color_interp}", style="bright_cyan")
-
-        # 内存和存储分析
-        console.print("\n💾 内存和存储分析:", style="bright_red bold")
-        console.print(
-            f"   📊 未压缩数据大小: {analysis_data['uncompressed_size']:,} 字节 ({analysis_data['uncompressed_size'] / (1024 * 1024):.2f} MB)",
-            style="red",
-        )
-        if file_info:
+        if coordinates.get("bounds_str"):
             console.print(
-                f"   📦 实际文件大小: {file_info['size_bytes']:,} 字节 ({file_info['size_mb']:.2f} MB)",
-                style="green",
+                f"   🌐 经纬度边界: {coordinates['bounds_str']}", style="bright_cyan"
             )
+        if coordinates.get("center_str"):
             console.print(
-                f"   🗜️  压缩效率: {analysis_data['compression_ratio']:.1f}% 压缩",
-                style="blue",
+                f"   📍 中心位置: {coordinates['center_str']}", style="bright_green"
             )
 
+        # 投影信息
+        projection = tiff_info.get("Projection")
+        if projection:
+            console.print("\n🌐 投影坐标系信息:", style="bright_yellow bold")
+            # 提取关键投影信息（单次扫描WKT得到三个名称）
+            proj_info = _extract_projection_info(projection)
+            if proj_info["projcs"]:
+                console.print(f"   📊 投影名称: {proj_info['projcs']}", style="yellow")
+            if proj_info["geogcs"]:
+                console.print(f"   🌍 地理坐标系: {proj_info['geogcs']}", style="green")
+            if proj_info["datum"]:
+                console.print(f"   📐 大地基准: {proj_info['datum']}", style="cyan")
+
+    # 波段详细分析
+    band_info_list = tiff_info.get("BandInfo")
+    if band_info_list:
+        console.print("\n📈 波段详细分析:", style="bright_red bold")
+        _display_band_details(console, band_info_list)
+
+    # 内存和存储分析
+    console.print("\n💾 内存和存储分析:", style="bright_red bold")
+    uncompressed_size = analysis_data["uncompressed_size"]
+    console.print(
+        f"   📊 未压缩数据大小: {uncompressed_size:,} 字节 ({uncompressed_size / (1024 * 1024):.2f} MB)",
+        style="red",
+    )
+    if file_info:
+        console.print(
+            f"   📦 实际文件大小: {file_info['size_bytes']:,} 字节 ({file_info['size_mb']:.2f} MB)",
+            style="green",
+        )
         console.print(
-            "\n📊 ============== 分析报告完成 ==============\n",
-            style="bright_yellow bold",
+            f"   🗜️  压缩效率: {analysis_data['compression_ratio']:.1f}% 压缩",
+            style="blue",
         )
 
+    console.print(
+        "\n📊 ============== 分析报告完成 ==============\n",
+        style="bright_yellow bold",
+    )
+
+
+def create_display_functions():
+    """返回显示函数字典（兼容旧接口，推荐直接导入对应函数）"""
     return {
         "display_tiff_basic_info": display_tiff_basic_info,
         "display_conversion_results": display_conversion_results,
@@ -0,0 +1,54 @@
+import json
+
+import numpy as np
+import pytest
+from osgeo import gdal
+
+from geotools import cli
+
+
+def test_expand_input_lists_reads_list_files(tmp_path):
+    list_file = tmp_path / "inputs.txt"
+    list_file.write_text("a.tif\n\n  b.tif  \n", encoding="utf-8")
+
+    assert cli._expand_input_lists(["x.tif", f"@{list_file}"]) == ["x.tif", "a.tif", "b.tif"]
+
+
+def test_tiff2png_rejects_duplicate_outputs_before_writing(tmp_path):
+    output_dir = tmp_path / "out"
+
+    with pytest.raises(SystemExit) as excinfo:
+        cli.tiff2png(["a/x.tif", "b/x.tif"], str(output_dir), show_info=False)
+
+    assert "x.png" in str(excinfo.value)
+    assert not output_dir.exists()
+
+
+def test_only_tiff2png_expands_list_files():
+    args = cli._build_parser().parse_args(["tiffinfo", "@inputs.txt"])
+
+    assert args.input_tif == "@inputs.txt"
+
+
+def test_json_compatible_replaces_non_finite_floats():
+    analysis = {
+        "BandInfo": [{"Min": float("nan"), "Max": np.float32("inf"), "Mean": np.float64(1.5)}],
+        "Size": (np.int64(2), 3),
+    }
+
+    document = cli._json_compatible(analysis)
+
+    assert document == {"BandInfo": [{"Min": None, "Max": None, "Mean": 1.5}], "Size": [2, 3]}
+    json.dumps(document, allow_nan=False)
+
+
+def test_cutiff_out_of_range_exits_cleanly_without_report(tmp_path):
+    input_tif = tmp_path / "image.tif"
+    dataset = gdal.GetDriverByName("GTiff").Create(str(input_tif), 8, 6, 1, gdal.GDT_Byte)
+    dataset.FlushCache()
+    dataset = None
+
+    with pytest.raises(SystemExit) as excinfo:
+        cli.cutiff(str(input_tif), str(tmp_path / "out.tif"), 4, 0, 8, 6, show_info=False)
+
+    assert "cutiff: 错误" in str(excinfo.value)
@@ -0,0 +1,60 @@
+import io
+
+from rich.console import Console
+
+from geotools import funcs
+
+# 足够长、包含长数字的WKT，窄控制台下硬折行会把数字从中间断开
+LONG_WKT = (
+    'PROJCS["WGS 84 / UTM zone 50N",GEOGCS["WGS 84",DATUM["WGS_1984",'
+    'SPHEROID["WGS 84",6378137,298.257223563,AUTHORITY["EPSG","7030"]],'
+    'AUTHORITY["EPSG","6326"]],PRIMEM["Greenwich",0,AUTHORITY["EPSG","8901"]],'
+    'UNIT["degree",0.0174532925199433,AUTHORITY["EPSG","9122"]],'
+    'AUTHORITY["EPSG","4326"]],PROJECTION["Transverse_Mercator"],'
+    'PARAMETER["latitude_of_origin",0],PARAMETER["central_meridian",117],'
+    'UNIT["metre",1,AUTHORITY["EPSG","9001"]],AUTHORITY["EPSG","32650"]]'
+)
+
+
+def _render(func, *args, width=80):
+    console = Console(file=io.StringIO(), width=width, color_system=None)
+    func(console, *args)
+    return console.file.getvalue()
+
+
+def test_projection_wkt_is_not_hard_wrapped_on_narrow_console():
+    output = _render(funcs._display_projection_info, LONG_WKT)
+    assert output == LONG_WKT + "\n"
+    assert "0.0174532925199433" in output
+
+
+def _render_basic_info(monkeypatch, info, width):
+    console = Console(file=io.StringIO(), width=width, color_system=None)
+    monkeypatch.setattr(funcs, "_get_console", lambda: console)
+    funcs.display_tiff_basic_info(info)
+    return console.file.getvalue()
+
+
+def test_basic_info_output_does_not_depend_on_console_width(monkeypatch):
+    band_info = [
+        {"BandNumber": n, "DataType": 2, "MinValue": 146.0, "MaxValue": 49641.0,
+         "MeanValue": 730.81155395508, "StdDev": 637.19915356351, "NoDataValue": None}
+        for n in (1, 2, 3)
+    ]
+    info = {
+        "FilePath": "/data/" + "very_long_directory_name/" * 4 + "image.tif",
+        "RasterXSize": 4000,
+        "RasterYSize": 5000,
+        "DataType": 2,
+        "GeoTransform": (500000.0, 10.0, 0.0, 4500000.0, 0.0, -10.0),
+        "Projection": LONG_WKT,
+        "BandInfo": band_info,
+        "Metadata": {"AREA_OR_POINT": "Area", "TIFFTAG_SOFTWARE": "x" * 120},
+    }
+
+    narrow = _render_basic_info(monkeypatch, info, width=80)
+    wide = _render_basic_info(monkeypatch, info, width=10000)
+
+    assert narrow == wide
+    assert f"{band_info}" in narrow
+    assert LONG_WKT in narrow
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from geotools import funcs
+
+
+def _reference_gray_process(gray, truncated_value=1, max_out=255, min_out=0):
+    """原始实现：float64 + np.percentile + 链式线性拉伸"""
+    gray_array = np.asarray(gray, dtype=np.float64)
+    if not np.any(gray_array) or np.allclose(gray_array, gray_array.flat[0]):
+        return np.full_like(gray_array, min_out, dtype=np.uint8)
+    lo, hi = np.percentile(gray_array, [truncated_value, 100 - truncated_value])
+    if np.isclose(hi, lo):
+        return np.full_like(gray_array, (max_out + min_out) // 2, dtype=np.uint8)
+    return np.clip(
+        (gray_array - lo) / (hi - lo) * (max_out - min_out) + min_out, min_out, max_out
+    ).astype(np.uint8)
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.uint16, np.int8, np.int16, np.int32, np.float64])
+@pytest.mark.parametrize("truncated_value", [0, 1, 2.5, 10])
+def test_matches_reference_implementation(dtype, truncated_value):
+    rng = np.random.default_rng(0)
+    if np.dtype(dtype).kind == "f":
+        gray = rng.normal(100, 30, (200, 250))
+    else:
+        info = np.iinfo(dtype)
+        center = 0 if info.min < 0 else info.max / 2
+        gray = np.clip(rng.normal(center, info.max / 6, (200, 250)), info.min, info.max).astype(dtype)
+
+    np.testing.assert_array_equal(
+        funcs.gray_process(gray, truncated_value), _reference_gray_process(gray, truncated_value)
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.int32, np.uint32, np.int64])
+def test_near_constant_large_integers_use_allclose_tolerance(dtype):
+    # 与 np.allclose 相同：|x - x0| <= 1e-8 + 1e-5 * |x0|，1e6 附近相差5以内视为常数
+    gray = np.full((50, 60), 1_000_000, dtype=dtype)
+    gray[::7, ::3] += 5
+
+    result = funcs.gray_process(gray)
+
+    np.testing.assert_array_equal(result, np.zeros(gray.shape, dtype=np.uint8))
+    np.testing.assert_array_equal(result, _reference_gray_process(gray))
+
+
+def test_small_integer_differences_are_still_stretched():
+    gray = np.full((50, 60), 1_000, dtype=np.int32)
+    gray[::2] += 5
+
+    result = funcs.gray_process(gray, truncated_value=0)
+
+    assert result.min() == 0 and result.max() == 255
+    np.testing.assert_array_equal(result, _reference_gray_process(gray, truncated_value=0))
+
+
+def test_strided_sample_covers_all_columns(monkeypatch):
+    # 行宽是朴素步长(3)的整数倍时，固定步长抽样只会落在每3列中的同一列上
+    monkeypatch.setattr(funcs, "_PERCENTILE_SAMPLE_SIZE", 1000)
+    gray = np.zeros((100, 30), dtype=np.float32)
+    gray[:, ::3] = 100.0
+
+    result = funcs.gray_process(gray, truncated_value=1)
+
+    assert set(np.unique(result)) == {0, 255}
@@ -0,0 +1,32 @@
+import numpy as np
+from osgeo import gdal
+
+from geotools import funcs
+
+
+def _write_tiff(path, bands=2, width=8, height=6):
+    dataset = gdal.GetDriverByName("GTiff").Create(str(path), width, height, bands, gdal.GDT_Byte)
+    dataset.SetGeoTransform((500000.0, 30.0, 0.0, 4000000.0, 0.0, -30.0))
+    for i in range(1, bands + 1):
+        dataset.GetRasterBand(i).WriteArray(np.arange(width * height, dtype=np.uint8).reshape(height, width) * i)
+    dataset.FlushCache()
+    dataset = None
+
+
+def test_mutating_result_does_not_corrupt_cache(tmp_path):
+    path = tmp_path / "image.tif"
+    _write_tiff(path)
+
+    first = funcs.tiffinfo(str(path))
+    expected_band_count = len(first["BandInfo"])
+    first["BandInfo"].clear()
+    first["GeoTransform"] = None
+    if first["Metadata"] is not None:
+        first["Metadata"]["injected"] = "x"
+
+    second = funcs.tiffinfo(str(path))
+
+    assert len(second["BandInfo"]) == expected_band_count == 2
+    assert second["BandInfo"][0]["BandNumber"] == 1
+    assert second["GeoTransform"] == (500000.0, 30.0, 0.0, 4000000.0, 0.0, -30.0)
+    assert "injected" not in (second["Metadata"] or {})